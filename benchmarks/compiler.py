@@ -0,0 +1,222 @@
+import sys
+import json
+import time
+import platform
+import tempfile
+import importlib
+import pathlib
+import argparse
+import subprocess
+import tracemalloc
+
+from yoloboros.grammar import transplainers
+
+HEADER = '''from yoloboros import Yoloboros
+
+
+class App(Yoloboros):
+    pass
+'''
+
+REACT = '''
+class Widget{i}(App.react):
+    def render():
+        with div(klass="widget-{i}"):
+            with span:
+                "Widget {i}"
+'''
+
+COMPONENT = '''
+class Component{i}(App.component):
+    def init(self):
+        return {{'value': {i}}}
+
+    def bump(self):
+        request = yield {{'value': self.state.value}}
+        response = yield {{'value': request['value'] + 1}}
+        self.state.value = response['value']
+        self.render()
+
+    def render(self):
+{body}
+'''
+
+ACTION = '''with button as btn{j}:
+    with btn{j}.click:
+        request = yield {{'value': self.state.value}}
+        response = yield {{'value': request['value'] + {j}}}
+        self.state.value = response['value']
+        self.render()
+    "Action {j}"'''
+
+# python refuses more than 20 nested blocks, and every action adds two
+CASES = {
+    'base': {},
+    'components': {'components': 200},
+    'depth': {'depth': 16},
+    'text': {'texts': 200},
+    'actions': {'actions': 20},
+    'react': {'react': 20},
+}
+
+DEFAULTS = {'components': 20, 'depth': 4, 'texts': 8, 'actions': 2, 'react': 2}
+
+
+def indent(lines, level):
+    return ['    ' * level + line for line in lines]
+
+
+def render(i, depth, texts, actions, react):
+    lines = []
+    for j in range(texts):
+        lines.append(f'f"Value {j}: {{self.state.value}}"' if j % 2 else f'"Static text {i}.{j} <b>&</b>"')
+    for j in range(actions):
+        lines += ACTION.format(j=j).split('\n')
+    for j in range(react):
+        lines += [f'with Widget{j}:', '    pass']
+    for level in reversed(range(depth)):
+        lines = [f'with div(klass="level-{level}"):'] + indent(lines or ['pass'], 1)
+    return '\n'.join(indent(lines or ['pass'], 2))
+
+
+def generate(directory, name, components=20, depth=4, texts=8, actions=2, react=2):
+    source = [HEADER]
+    source += [REACT.format(i=i) for i in range(react)]
+    source += [
+        COMPONENT.format(i=i, body=render(i, depth, texts, actions, react))
+        for i in range(components)
+    ]
+    (pathlib.Path(directory) / f'{name}.py').write_text('\n'.join(source))
+    return importlib.import_module(name)
+
+
+def compile_time(module, repeat, **flags):
+    # building deletes action methods from the classes, so every run reloads the module
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app = importlib.reload(module).App
+        for k, v in flags.items():
+            setattr(app, k, v)
+        app.code
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, app
+
+
+def peak_memory(module):
+    # only App.code is traced, importing the module would dwarf it with bytecode and class objects
+    app = importlib.reload(module).App
+    tracemalloc.start()
+    try:
+        app.code
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def tree_memory(module):
+    # bytes held by the js trees of every render, the python ast they come from is built untraced
+    app = importlib.reload(module).App
+    rendered = [
+        app.node_renderer(c.render, namespace=dict(app=app, component=c)).walk()
+        for c in app.component.registry.values() if hasattr(c, 'render')
+    ]
+    tracemalloc.start()
+    try:
+        trees = [transplainers.JsTranslator(r).walk() for r in rendered]
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def throughput(app, duration):
+    calls = [
+        {'identifier': identifier, 'action': action, 'request': {'value': 1}}
+        for identifier, component in app.component.registry.items()
+        for action in component.responses
+    ]
+    if not calls:
+        return None
+    count = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < duration:
+        for data in calls:
+            app.process(data)
+        count += len(calls)
+    return count / elapsed
+
+
+def measure(directory, name, params, repeat=3, duration=0.5):
+    module = generate(directory, name, **params)
+    seconds, app = compile_time(module, repeat)
+    return {
+        'params': params,
+        'compile': seconds,
+        'peak': peak_memory(module),
+        'tree': tree_memory(module),
+        'bytes': app.bundle.size,
+        'process': throughput(app, duration),
+    }
+
+
+def commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True, cwd=pathlib.Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    print(f'{"case":>12} {"compile":>10} {"peak":>10} {"tree":>10} {"bytes":>10} {"process":>10}')
+    for case, result in results.items():
+        if case not in baseline:
+            continue
+        old = baseline[case]
+        ratios = [
+            result[k] / old[k] if result.get(k) and old.get(k) else float('nan')
+            for k in ('compile', 'peak', 'tree', 'bytes', 'process')
+        ]
+        print(f'{case:>12}' + ''.join(f' {r:>9.2f}x' for r in ratios))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compile synthetic apps and report timings as JSON')
+    parser.add_argument('cases', nargs='*', help=f'cases to run, all by default: {", ".join(CASES)}')
+    parser.add_argument('-o', '--output', help='write results to this file')
+    parser.add_argument('-c', '--compare', help='print ratios against a previous results file')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='compile runs, the best one is kept')
+    parser.add_argument('-d', '--duration', type=float, default=0.5, help='seconds spent calling process()')
+    args = parser.parse_args(argv)
+    if unknown := set(args.cases) - set(CASES):
+        parser.error(f'unknown cases: {", ".join(sorted(unknown))}')
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        for case in args.cases or CASES:
+            params = {**DEFAULTS, **CASES[case]}
+            results[case] = measure(directory, f'synthetic_{case}', params, args.repeat, args.duration)
+            result = results[case]
+            print(
+                f'{case:>12} {result["compile"]:>8.3f}s {result["peak"] / 2 ** 20:>7.1f}MiB'
+                f' {result["tree"] / 2 ** 10:>7.0f}KiB'
+                f' {result["bytes"]:>9}B {result["process"] or 0:>9.0f}/s',
+                file=sys.stderr,
+            )
+
+    report = {'commit': commit(), 'python': platform.python_version(), 'results': results}
+    if args.output:
+        pathlib.Path(args.output).write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        compare(results, json.loads(pathlib.Path(args.compare).read_text())['results'])
+    return report
+
+
+if __name__ == '__main__':
+    main()
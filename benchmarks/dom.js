@@ -0,0 +1,180 @@
+// minimal DOM for running compiled apps under node; counts mutations of the attached tree
+const fs = require('fs');
+const vm = require('vm');
+
+let mutations = 0;
+const size = (node) => 1 + node.childNodes.reduce((total, child) => total + size(child), 0);
+const attached = (node) => {
+    for (; node; node = node.parentNode) {
+        if (node === body) return 1;
+    }
+    return 0;
+};
+
+class Node_ {
+    constructor() {
+        this.parentNode = null;
+        this.childNodes = [];
+    }
+
+    get firstChild() {
+        return this.childNodes[0] || null;
+    }
+
+    get nextSibling() {
+        return this.parentNode ? this.parentNode.childNodes[this.parentNode.childNodes.indexOf(this) + 1] || null : null;
+    }
+}
+
+class Text extends Node_ {
+    constructor(data) {
+        super();
+        this._data = data;
+    }
+
+    get nodeType() { return 3; }
+    get data() { return this._data; }
+    set data(value) { mutations += attached(this); this._data = value; }
+    get outerHTML() { return this._data; }
+    cloneNode() { return new Text(this._data); }
+}
+
+class Element extends Node_ {
+    constructor(tag) {
+        super();
+        this.tagName = tag;
+        this.attrs = {};
+        this.style = {};
+        this.listeners = {};
+    }
+
+    get nodeType() { return 1; }
+    get attributes() { return Object.entries(this.attrs).map(([name, value]) => ({name, value})); }
+    get children() { return this.childNodes.filter((node) => node instanceof Element); }
+    get lastChild() { return this.childNodes[this.childNodes.length - 1] || null; }
+    set className(value) { this.setAttribute('class', value); }
+
+    getAttribute(name) { return name in this.attrs ? this.attrs[name] : null; }
+    setAttribute(name, value) { mutations += attached(this); this.attrs[name] = String(value); }
+    removeAttribute(name) { mutations += attached(this); delete this.attrs[name]; }
+    addEventListener(event, callback) { (this.listeners[event] = this.listeners[event] || []).push(callback); }
+    removeEventListener(event, callback) { this.listeners[event] = (this.listeners[event] || []).filter((cb) => cb !== callback); }
+    dispatch(event) { (this.listeners[event] || []).forEach((callback) => callback({type: event})); }
+
+    insertBefore(node, reference) {
+        if (node.parentNode) node.parentNode.removeChild(node);
+        const index = reference ? this.childNodes.indexOf(reference) : this.childNodes.length;
+        this.childNodes.splice(index, 0, node);
+        node.parentNode = this;
+        mutations += attached(this) * size(node);
+        return node;
+    }
+
+    appendChild(node) { return this.insertBefore(node, null); }
+
+    removeChild(node) {
+        mutations += attached(this) * size(node);
+        this.childNodes.splice(this.childNodes.indexOf(node), 1);
+        node.parentNode = null;
+        return node;
+    }
+
+    get innerHTML() { return this.childNodes.map((node) => node.outerHTML).join(''); }
+    set innerHTML(value) {
+        while (this.childNodes.length) this.removeChild(this.lastChild);
+        if (value) this.appendChild(new Text(value));
+    }
+
+    insertAdjacentHTML(position, value) { this.appendChild(new Text(value)); }
+
+    cloneNode(deep) {
+        const element = new Element(this.tagName);
+        element.attrs = {...this.attrs};
+        if (deep) {
+            this.childNodes.forEach((node) => element.appendChild(node.cloneNode(true)));
+        }
+        return element;
+    }
+
+    get outerHTML() {
+        const attrs = this.attributes.map(({name, value}) => ` ${name}="${value}"`).join('');
+        return `<${this.tagName}${attrs}>${this.innerHTML}</${this.tagName}>`;
+    }
+}
+
+// enough html parsing for the markup of compiled static templates
+const VOID = ['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'];
+const parse = (html) => {
+    const stack = [new Element('template')];
+    const pattern = /<(\/?)([a-z0-9]+)((?:\s+[^\s=>]+=(?:"[^"]*"|'[^']*'))*)\s*>|([^<]+)/g;
+    for (const [, closing, tag, attrs, text] of html.matchAll(pattern)) {
+        if (text) {
+            stack[stack.length - 1].appendChild(new Text(text));
+        } else if (closing) {
+            stack.pop();
+        } else {
+            const element = stack[stack.length - 1].appendChild(new Element(tag));
+            for (const [, name, double, single] of attrs.matchAll(/([^\s=]+)=(?:"([^"]*)"|'([^']*)')/g)) {
+                element.attrs[name] = double === undefined ? single : double;
+            }
+            if (!VOID.includes(tag)) stack.push(element);
+        }
+    }
+    return stack[0];
+};
+
+class Template extends Element {
+    constructor() {
+        super('template');
+        this.content = new Element('template');
+    }
+
+    set innerHTML(value) { this.content = parse(value); }
+}
+
+const find = (node, id) => {
+    if (node.attrs && node.attrs.id === id) return node;
+    for (const child of node.children || []) {
+        const found = find(child, id);
+        if (found) return found;
+    }
+    return null;
+};
+
+const body = new Element('body');
+const root = body.appendChild(new Element('div'));
+root.setAttribute('id', 'root');
+
+let uuid = 0;
+const context = {
+    console,
+    queueMicrotask,
+    Node: Node_,
+    crypto: {randomUUID: () => `uuid-${uuid++}`},
+    document: {
+        body,
+        createElement: (tag) => tag === 'template' ? new Template() : new Element(tag),
+        getElementById: (id) => find(body, id),
+    },
+    fetch: () => Promise.reject(new Error('no server in benchmarks')),
+    React: {createElement: (type, props) => ({type, props})},
+    ReactDOM: {render: () => null},
+};
+vm.createContext(context);
+vm.runInContext(fs.readFileSync(process.argv[2], 'utf8'), context);
+
+// every button re-renders its component once per click
+const buttons = [];
+const collect = (node) => {
+    if (node.tagName === 'button') buttons.push(node);
+    node.children.forEach(collect);
+};
+collect(root);
+const rounds = parseInt(process.argv[3] || '10');
+mutations = 0;
+const start = process.hrtime.bigint();
+for (let i = 0; i < rounds; i++) {
+    buttons.forEach((button) => button.dispatch('click'));
+}
+const elapsed = Number(process.hrtime.bigint() - start) / 1e6;
+console.log(JSON.stringify({renders: rounds * buttons.length, mutations, elapsed}));
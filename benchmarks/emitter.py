@@ -0,0 +1,61 @@
+import sys
+import time
+import tracemalloc
+
+from yoloboros import constants
+from yoloboros.grammar import syntax as grammar
+
+
+def text(value):
+    return grammar.JsExpr(value=grammar.JsCall(
+        func=grammar.JsName(id=constants.COMPONENT_TEXT),
+        args=[grammar.JsName(id='current'), grammar.JsConstant(value)],
+        keywords=[],
+    ))
+
+
+def tree(depth, width):
+    # the same shape NodeRenderer gives nested `with` blocks, without python's 20 block limit
+    body = [text(f'leaf {i}') for i in range(width)]
+    for level in reversed(range(depth)):
+        lambda_ = grammar.MultilineLambda(
+            args=grammar.Jsarguments(
+                posonlyargs=[], args=[grammar.JsName(id='current')], vararg=None,
+                kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[],
+            ),
+            body=[text(f'level {level}'), *body],
+        )
+        body = [grammar.JsExpr(value=grammar.JsCall(
+            func=grammar.JsName(id=constants.COMPONENT_NODE_CREATE),
+            args=[grammar.JsConstant('div'), grammar.JsConstant(str(level)), grammar.JsConstant(None),
+                  grammar.JsName(id='current'), grammar.JsConstant(None), lambda_],
+            keywords=[],
+        ))]
+    return grammar.JsModule(body=body, type_ignores=[])
+
+
+def measure(depth, width, repeat):
+    tracemalloc.start()
+    node = tree(depth, width)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        code = node.render()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(code), memory
+
+
+def main(depths, width=4, repeat=3):
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20 * max(depths)))
+    # indentation makes the output itself grow with depth squared, so compare time per byte
+    print(f'{"depth":>8} {"bytes":>10} {"seconds":>10} {"ns/byte":>10} {"tree KiB":>10}')
+    for depth in depths:
+        seconds, size, memory = measure(depth, width, repeat)
+        print(f'{depth:>8} {size:>10} {seconds:>10.4f} {seconds / size * 1e9:>10.1f} {memory / 1024:>10.1f}')
+
+
+if __name__ == '__main__':
+    main([int(i) for i in sys.argv[1:]] or [50, 100, 200, 400, 800])
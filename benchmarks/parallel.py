@@ -0,0 +1,21 @@
+import sys
+import tempfile
+
+from compiler import compile_time, generate
+
+
+def main(counts):
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        print(f'{"components":>10} {"serial":>10} {"parallel":>10} {"speedup":>8}')
+        for count in counts:
+            module = generate(directory, f'synthetic_{count}', components=count)
+            serial, serial_app = compile_time(module, 1, parallel=False)
+            serial_code = serial_app.code
+            parallel, parallel_app = compile_time(module, 1, parallel=True)
+            assert serial_code == parallel_app.code
+            print(f'{count:>10} {serial:>10.3f} {parallel:>10.3f} {serial / parallel:>8.2f}')
+
+
+if __name__ == '__main__':
+    main([int(i) for i in sys.argv[1:]] or [10, 50, 100, 200, 400])
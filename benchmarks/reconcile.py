@@ -0,0 +1,80 @@
+import sys
+import json
+import shutil
+import tempfile
+import importlib
+import pathlib
+import subprocess
+
+COMPONENT = '''
+class Component{i}(App.component):
+    def init(self):
+        return {{'value': 0, 'items': [1, 2, 3, 4, 5]}}
+
+    def render(self):
+        with div(klass="component-{i}"):
+            with p(klass="note"):
+                "Static note"
+                with b:
+                    "bold"
+            f"Value: {{self.state.value}}"
+            with ul:
+                for item in self.state.items:
+                    with li(klass="item"):
+                        f"Item {{item}}"
+            with input(value=self.state.value):
+                pass
+            with button as btn:
+                with btn.click:
+                    self.state.value += 1
+                    self.render()
+                "Click"
+'''
+
+ROOT = '''
+class Root(App.root):
+    def render(self):
+{children}
+'''
+
+
+def generate(directory, count):
+    name = f'reconcile_{count}'
+    source = ['from yoloboros import Yoloboros', '', '', 'class App(Yoloboros):', '    pass', '']
+    source += [COMPONENT.format(i=i) for i in range(count)]
+    source.append(ROOT.format(children='\n'.join(
+        f'        with Component{i}:\n            pass' for i in range(count)
+    )))
+    (pathlib.Path(directory) / f'{name}.py').write_text('\n'.join(source))
+    return importlib.import_module(name)
+
+
+def measure(directory, module, reconcile, rounds):
+    app = importlib.reload(module).App
+    app.reconcile = reconcile
+    path = pathlib.Path(directory) / f'{module.__name__}_{reconcile}.js'
+    path.write_text(app.prelude + app.mount('root'))
+    script = pathlib.Path(__file__).with_name('dom.js')
+    result = subprocess.run(['node', script, path, str(rounds)], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def main(counts, rounds=20):
+    if not shutil.which('node'):
+        sys.exit('node is required to run this benchmark')
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        # DOM mutations per re-render and wall time for all renders
+        print(f'{"components":>10} {"rebuild":>16} {"reconcile":>16}')
+        for count in counts:
+            module = generate(directory, count)
+            cells = []
+            for reconcile in (False, True):
+                result = measure(directory, module, reconcile, rounds)
+                per_render = result['mutations'] / result['renders']
+                cells.append(f'{per_render:>8.1f} {result["elapsed"]:>6.0f}ms')
+            print(f'{count:>10} {cells[0]:>16} {cells[1]:>16}')
+
+
+if __name__ == '__main__':
+    main([int(i) for i in sys.argv[1:]] or [1, 10, 50])
@@ -0,0 +1,30 @@
+import sys
+import argparse
+import importlib
+
+
+def load(target):
+    module, _, name = target.partition(':')
+    if not name:
+        raise SystemExit(f'Expected module:App, got {target!r}')
+    return getattr(importlib.import_module(module), name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m yoloboros')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='compile an app into static files and an action manifest')
+    build.add_argument('app', help='application to build, as module:App')
+    build.add_argument('--out', default='dist', help='output directory')
+
+    args = parser.parse_args(argv)
+    if args.command == 'build':
+        manifest = load(args.app).build(args.out)
+        print(f"{args.out}/{manifest['prelude']}")
+        print(f"{args.out}/{manifest['bundle']}")
+        print(f"{args.out}/manifest.json")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,27 @@
+import os
 import ast
+import gzip
+import json
+import pickle
 import uuid
+import types
+import marshal
+import hashlib
 import inspect
+import builtins
+import importlib.util
 import textwrap
 import pathlib
+import functools
+import concurrent.futures
 
 from yoloboros.grammar import transplainers
 from yoloboros import constants
+from yoloboros import metrics
+from yoloboros import minify
+from yoloboros import profiler
+from yoloboros import sourcemap
+from yoloboros import ssr
 
 
 class Box:
@@ -19,10 +35,98 @@ class Box:
         self.__value = value
 
 
+def compile_component(app, identifier):
+    component = app.component.registry[identifier]
+    return marshal.dumps(component.dump(component.build(app)))
+
+
+class Bundle:
+    def __init__(self, react='', chunks=None):
+        self.marked_react = react
+        self.marked_chunks = chunks or {}
+        self.react = sourcemap.strip(react)
+        self.chunks = {k: sourcemap.strip(v) for k, v in self.marked_chunks.items()}
+        self.code = self.join()
+        data = self.code.encode()
+        self.size = len(data)
+        self.hash = hashlib.sha256(data).hexdigest()
+
+    def join(self, names=None, marked=False):
+        react, chunks = (self.marked_react, self.marked_chunks) if marked else (self.react, self.chunks)
+        return react + ';\n'.join(v for k, v in chunks.items() if names is None or k in names)
+
+
+class Asset:
+    def __init__(self, name, code, source_map=None):
+        self.name = name
+        self.hash = hashlib.sha256(code.encode()).hexdigest()
+        self.path = f'{name}.{self.hash[:16]}.js'
+        self.map = None
+        if source_map is not None:
+            self.map = json.dumps({**source_map, 'file': self.path})
+            code += f'\n//# sourceMappingURL={self.path}.map\n'
+        self.body = code.encode()
+        self.gzip = gzip.compress(self.body, mtime=0)
+        self.headers = {
+            'Content-Type': 'application/javascript; charset=utf-8',
+            'Content-Length': str(len(self.body)),
+            'Cache-Control': 'public, max-age=31536000, immutable',
+            'ETag': f'"{self.hash[:32]}"',
+            'Vary': 'Accept-Encoding',
+        }
+        self.gzip_headers = {
+            **self.headers,
+            'Content-Length': str(len(self.gzip)),
+            'Content-Encoding': 'gzip',
+            # a different body, so a different strong validator
+            'ETag': f'"{self.hash[:32]}-gzip"',
+        }
+
+    def respond(self, accept_encoding=''):
+        if accepts(accept_encoding, 'gzip'):
+            return self.gzip, self.gzip_headers
+        return self.body, self.headers
+
+
+def accepts(accept_encoding, coding):
+    # Accept-Encoding weights, `gzip;q=0` and `*;q=0` refuse the coding
+    weights = {}
+    for item in accept_encoding.lower().split(','):
+        name, *params = [part.strip() for part in item.split(';')]
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+    return weights.get(coding, weights.get('*', 0.0)) > 0
+
+
+@functools.cache
+def compiler_hash():
+    root = pathlib.Path(__file__).parent
+    key = hashlib.sha256()
+    for path in sorted(root.rglob('*')):
+        if path.suffix in ('.py', '.js'):
+            key.update(path.relative_to(root).as_posix().encode())
+            key.update(path.read_bytes())
+    return key.hexdigest()
+
+
+@functools.cache
+def read_prelude(minified):
+    prelude = (pathlib.Path(__file__).parent / 'yolo.js').read_text()
+    return minify.compact(prelude) if minified else prelude
+
+
 class ComponentMeta(type):
     def __new__(mcls, name, bases, attrs, app=None):
         attrs["requests"] = dict()
         attrs["responses"] = dict()
+        attrs["children"] = list()
         if app:
             attrs["app"] = app
         else:
@@ -46,38 +150,125 @@ class BaseComponent:
         component = cls.registry[identifier]
         return component.responses[action](component, request)
 
+    @classmethod
+    def actions(cls):
+        return {
+            k: v for k, v in vars(cls).items()
+            if not k.startswith("_") and k != 'render' and k != 'fetch'
+            and (inspect.isgeneratorfunction(v) or inspect.isasyncgenfunction(v))
+        }
+
+    @classmethod
+    def cache_key(cls, app):
+        key = hashlib.sha256()
+        key.update(constants.VERSION.encode())
+        # marshalled code only loads on the interpreter that wrote it, and js only fits the compiler that made it
+        key.update(importlib.util.MAGIC_NUMBER)
+        key.update(compiler_hash().encode())
+        key.update(f'{cls.__module__}.{cls.__qualname__}:{cls.identifier}:{app.pyodide}:{app.minify}'.encode())
+        key.update(' '.join(c.__name__ for c in cls.registry.values()).encode())
+        lines, start = inspect.getsourcelines(cls)
+        # source map markers hold absolute lines, so a class that moved needs a new build
+        key.update(f'{start}:{"".join(lines)}'.encode())
+        return key.hexdigest()
+
+    @classmethod
+    def dump(cls, code):
+        return {
+            'code': code,
+            'requests': dict(cls.requests),
+            'responses': {k: v.__code__ for k, v in cls.responses.items()},
+            'sources': {k: getattr(v, '__src') for k, v in cls.responses.items()},
+            'children': cls.children,
+        }
+
+    @classmethod
+    def load(cls, entry):
+        for k in cls.actions():
+            delattr(cls, k)
+        cls.requests.update(entry['requests'])
+        cls.children = entry['children']
+        for k, v in entry['responses'].items():
+            cls.responses[k] = types.FunctionType(v, {'__builtins__': builtins})
+            setattr(cls.responses[k], '__src', entry['sources'][k])
+        return entry['code']
+
+    @classmethod
+    def html_render(cls, app):
+        if '_html_render' not in vars(cls):
+            cls._html_render = None
+            if hasattr(cls, 'render'):
+                ns = dict(app=app, component=cls)
+                render = ast.fix_missing_locations(transplainers.ServerRenderer(cls.render, namespace=ns).walk())
+                cls._html_render = transplainers.define(ast.unparse(render))
+        return cls._html_render
+
     @classmethod
     def build(cls, app):
-        for k, v in vars(cls).copy().items():
-            if not k.startswith("_") and inspect.isgeneratorfunction(v) and k != 'render' and k != 'fetch':
-                cls.requests[k], cls.responses[k] = app.action_renderer(
-                    v.__name__, v
-                ).build_funcs()
-                delattr(cls, k)
+        with profiler.component(cls.__name__):
+            if app.cache_dir is None:
+                return cls.compile(app)
+
+            path = pathlib.Path(app.cache_dir) / f'{cls.cache_key(app)}.marshal'
+            try:
+                return profiler.measure('cache', lambda: cls.load(marshal.loads(path.read_bytes())))
+            except (OSError, EOFError, ValueError, TypeError, KeyError):
+                pass
+
+            code = cls.compile(app)
+            with profiler.phase('store') as record:
+                data = marshal.dumps(cls.dump(code))
+                record.size = len(data)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+            return code
+
+    @classmethod
+    def compile(cls, app):
+        def located(code, func):
+            return sourcemap.relocate(code, cls.__module__, profiler.measure('getsource', inspect.getsourcelines, func)[1])
+
+        for k, v in cls.actions().items():
+            request, cls.responses[k] = app.action_renderer(
+                v.__name__, v
+            ).build_funcs()
+            if not isinstance(request, str):
+                request = profiler.measure('render', request.render)
+            cls.requests[k] = located(request, v)
+            delattr(cls, k)
 
         if hasattr(cls, 'fetch'):
             init, response_fetch = app.fetch_renderer(cls.identifier, cls.fetch).build_funcs()
+            init = located(init, cls.fetch)
             cls.responses.setdefault('fetch', response_fetch)
         elif hasattr(cls, 'init'):
             init = transplainers.JsTranslator(cls.init).walk()
             init.body[0].name = constants.COMPONENT_INIT
-            init = textwrap.dedent(init.render())
+            init = located(textwrap.dedent(profiler.measure('render', init.render)), cls.init)
         else:
             init = f"const {constants.COMPONENT_INIT} = () => null;\n"
 
         if hasattr(cls, 'render'):
-            ns = dict(app=app)
+            ns = dict(app=app, component=cls)
             render = ast.fix_missing_locations(app.node_renderer(cls.render, namespace=ns).walk())
-            render = transplainers.JsTranslator(render).walk().render()
+            render = transplainers.JsTranslator(render).walk()
+            render = located(profiler.measure('render', render.render), cls.render)
             if actions := ns.get('actions'):
                 for action, (request, response) in actions.items():
-                    cls.requests.setdefault(action, request)
+                    cls.requests.setdefault(action, located(request, cls.render))
                     cls.responses.setdefault(action, response)
+            cls.children = sorted(ns.get('children', ()))
         else:
             render = f"const {constants.COMPONENT_RENDER} = () => null;\n"
 
-        ret = '\n'.join(component.react_code for component in app.react.registry.values())
-        ret += textwrap.dedent(
+        ret = profiler.measure('indent', cls.assemble, init, render)
+        return profiler.measure('minify', minify.compact, ret) if app.minify else ret
+
+    @classmethod
+    def assemble(cls, init, render):
+        ret = textwrap.dedent(
             f"""(() => {{
             const {constants.COMPONENT_IDENTIFIER} = "{cls.identifier}";
             const {constants.COMPONENT_ACTIONS} = {{}};\n
@@ -86,8 +277,6 @@ class BaseComponent:
             """
         ).lstrip()
         for k, v in cls.requests.items():
-            if not isinstance(v, str):
-                v = v.render()
             ret += textwrap.indent(f'{constants.COMPONENT_ACTIONS}["{k}"] = {v};\n', '    ' * 3)
 
         is_root = 'true' if cls.is_root else 'false'
@@ -102,6 +291,7 @@ class BaseComponent:
         if cls.__name__ not in {'__yolo__component', '__yolo__root'}:
             cls.identifier = str(len(cls.registry))
             cls.registry[cls.identifier] = cls
+            cls.app().invalidate()
 
 
 class BaseReactComponent:
@@ -110,7 +300,9 @@ class BaseReactComponent:
     def __init_subclass__(cls):
         if cls.__name__ not in {'__yolo__react'}:
             cls.registry[cls.__name__] = cls
-            cls.react_code = transplainers.ReactTransplainer(cls).walk().render()
+            react_code = transplainers.ReactTransplainer(cls).walk().render()
+            cls.react_code = sourcemap.relocate(react_code, cls.__module__, inspect.getsourcelines(cls)[1])
+            cls.app().invalidate()
 
 
 class AppicationMeta(type):
@@ -122,6 +314,7 @@ class AppicationMeta(type):
 
         class __yolo__react(BaseReactComponent):
             registry = dict()
+            app = box
 
         class __yolo__root(__yolo__component):
             is_root = True
@@ -130,6 +323,9 @@ class AppicationMeta(type):
         attrs["component"] = __yolo__component
         attrs["root"] = __yolo__root
         attrs["react"] = __yolo__react
+        attrs["_bundle"] = None
+        attrs["_assets"] = None
+        attrs["_hooks"] = []
         ret = super(mcls, AppicationMeta).__new__(mcls, name, bases, attrs)
         box._set(ret)
         return ret
@@ -141,21 +337,176 @@ class BaseYoloboros:
 
 class Yoloboros(BaseYoloboros, metaclass=AppicationMeta):
     pyodide: bool = False
+    cache_dir: str | None = None
+    parallel: bool = False
+    split: bool = False
+    batch: bool = False
+    endpoint: str = '/'
+    reconcile: bool = False
+    minify: bool = False
+    sourcemap: bool = False
 
     @classmethod
     def process(cls, data):
-        return cls.component.process(data)
+        if 'batch' in data:
+            return cls.process_batch(data)
+        if 'chunk' in data:
+            return {'code': cls.chunk(data['chunk'])}
+        if not cls._hooks:
+            return cls.component.process(data)
+
+        call = metrics.Call(cls, data)
+        call.notify('before')
+        try:
+            ret = cls.component.process(data)
+        except Exception as e:
+            call.fail(e)
+            raise
+        if inspect.isawaitable(ret):
+            return call.wait(ret)
+        return call.done(ret)
+
+    @classmethod
+    def add_hook(cls, hook):
+        cls._hooks.append(hook)
+        return hook
+
+    @classmethod
+    def remove_hook(cls, hook):
+        cls._hooks.remove(hook)
+
+    @classmethod
+    def process_batch(cls, data):
+        ret = []
+        for item in data['batch']:
+            try:
+                if cls.is_async(item):
+                    # nothing here could await it, so it is not even started
+                    raise TypeError('async action in a batch, serve it with aprocess')
+                ret.append({'response': cls.process(item)})
+            except Exception as e:
+                ret.append({'error': f'{type(e).__name__}: {e}'})
+        return {'batch': ret}
+
+    @classmethod
+    def is_async(cls, item):
+        component = cls.component.registry.get(item.get('identifier'))
+        handler = component and component.responses.get(item.get('action'))
+        return inspect.iscoroutinefunction(handler)
+
+    @classmethod
+    async def aprocess(cls, data):
+        if 'batch' in data:
+            return await cls.aprocess_batch(data)
+        ret = cls.process(data)
+        if inspect.isawaitable(ret):
+            ret = await ret
+        return ret
+
+    @classmethod
+    async def aprocess_batch(cls, data):
+        # one after another, so side effects happen in the order the client queued the calls
+        ret = []
+        for item in data['batch']:
+            try:
+                ret.append({'response': await cls.aprocess(item)})
+            except Exception as e:
+                ret.append({'error': f'{type(e).__name__}: {e}'})
+        return {'batch': ret}
+
+    @classmethod
+    def invalidate(cls):
+        cls._bundle = None
+        cls._assets = None
+
+    @classmethod
+    @property
+    def bundle(cls):
+        if cls._bundle is None:
+            react = '\n'.join(c.react_code for c in cls.react.registry.values())
+            if cls.minify and react:
+                react = minify.compact(react)
+            components = cls.component.registry.values()
+            if cls.parallel and profiler.current is None and (os.cpu_count() or 1) > 1:
+                codes = cls.build_parallel()
+            else:
+                codes = [c.build(cls) for c in components]
+            chunks = {c.__name__: code for c, code in zip(components, codes)}
+            cls._bundle = Bundle(react, chunks)
+        return cls._bundle
+
+    @classmethod
+    def profile(cls):
+        previous, profiler.current = profiler.current, profiler.Profiler()
+        try:
+            cls.invalidate()
+            with profiler.phase('bundle'):
+                cls.bundle
+            return profiler.current.report()
+        finally:
+            profiler.current = previous
+
+    @classmethod
+    def build_parallel(cls):
+        registry = cls.component.registry
+        workers = os.cpu_count() or 1
+        try:
+            with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+                chunksize = max(1, len(registry) // (4 * workers))
+                entries = pool.map(compile_component, [cls] * len(registry), registry, chunksize=chunksize)
+                return [c.load(marshal.loads(e)) for c, e in zip(registry.values(), entries)]
+        except (pickle.PicklingError, AttributeError, ImportError, concurrent.futures.BrokenExecutor):
+            # workers look the app up by module path, which fails under spawn for apps
+            # made in __main__ or a notebook; the serial build gives the same result
+            return [c.build(cls) for c in registry.values()]
 
     @classmethod
     @property
     def code(cls):
-        components = cls.component.registry.values()
-        return ';\n'.join(c.build(cls) for c in components)
+        return cls.bundle.code
+
+    @classmethod
+    @property
+    def bundle_hash(cls):
+        return cls.bundle.hash
+
+    @classmethod
+    def chunk(cls, name):
+        return cls.bundle.chunks[name]
+
+    @classmethod
+    @property
+    def initial_components(cls):
+        cls.bundle
+        components = {c.__name__: c for c in cls.component.registry.values()}
+        names = [cls.root_name]
+        for name in names:
+            names += [c for c in components[name].children if c not in names]
+        return names
+
+    @classmethod
+    @property
+    def initial_code(cls):
+        return cls.bundle.join(cls.initial_components)
 
     @classmethod
     @property
     def prelude(cls):
-        return (pathlib.Path(__file__).parent / 'yolo.js').read_text()
+        return read_prelude(cls.minify)
+
+    @classmethod
+    def assets(cls):
+        if cls._assets is None:
+            names = cls.initial_components if cls.split else None
+            if cls.sourcemap:
+                code, source_map = sourcemap.extract(cls.bundle.join(names, marked=True))
+            else:
+                code, source_map = cls.bundle.join(names), None
+            cls._assets = {
+                'prelude': Asset('prelude', cls.prelude),
+                'bundle': Asset('bundle', code, source_map),
+            }
+        return cls._assets
 
     @classmethod
     @property
@@ -182,6 +533,61 @@ class Yoloboros(BaseYoloboros, metaclass=AppicationMeta):
             return transplainers.FetchRenderer
 
     @classmethod
-    def mount(cls, id):
-        name = next((c.__name__ for c in cls.component.registry.values() if c.is_root), None)
-        return cls.code + f'YOLO_COMPONENTS["{name}"].make().render("{id}")'
+    def build(cls, out):
+        out = pathlib.Path(out)
+        out.mkdir(parents=True, exist_ok=True)
+        manifest = {'version': constants.VERSION, 'root': cls.root_name}
+        for name, asset in cls.assets().items():
+            manifest[name] = asset.path
+            (out / asset.path).write_bytes(asset.body)
+            (out / f'{asset.path}.gz').write_bytes(asset.gzip)
+            if asset.map:
+                (out / f'{asset.path}.map').write_text(asset.map)
+        manifest['components'] = {}
+        for identifier, component in cls.component.registry.items():
+            manifest['components'][identifier] = {
+                'name': component.__name__,
+                'responses': {k: getattr(v, '__src') for k, v in component.responses.items()},
+            }
+        (out / 'manifest.json').write_text(json.dumps(manifest, indent=2))
+        return manifest
+
+    @classmethod
+    def load_manifest(cls, path):
+        manifest = json.loads(pathlib.Path(path).read_text())
+        for identifier, entry in manifest['components'].items():
+            component = cls.component.registry.get(identifier)
+            if component is None or component.__name__ != entry['name']:
+                raise ValueError(f"Manifest component {entry['name']} ({identifier}) is not registered")
+            for action, source in entry['responses'].items():
+                component.responses[action] = transplainers.define(source)
+        return manifest
+
+    @classmethod
+    @property
+    def root_name(cls):
+        return next((c.__name__ for c in cls.component.registry.values() if c.is_root), None)
+
+    @classmethod
+    @property
+    def config(cls):
+        return {'batch': cls.batch, 'endpoint': cls.endpoint, 'reconcile': cls.reconcile}
+
+    @classmethod
+    def render_html(cls, id, root_state=ssr.MISSING):
+        cls.bundle
+        return ssr.HTML(cls).root(id, root_state)
+
+    @classmethod
+    def mount(cls, id, hydrate=False):
+        code = cls.initial_code if cls.split else cls.code
+        return cls.bootstrap(id, hydrate, code)
+
+    @classmethod
+    def bootstrap(cls, id, hydrate=False, code=''):
+        call = 'hydrate' if hydrate else 'make().render'
+        return (
+            f'Object.assign(YOLO_CONFIG, {json.dumps(cls.config)});\n'
+            + code
+            + f'YOLO_COMPONENTS["{cls.root_name}"].{call}("{id}")'
+        )
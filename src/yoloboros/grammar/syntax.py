@@ -1,88 +1,239 @@
 import ast
 import string
-import itertools
 import sys
 import textwrap
 import functools
+import contextlib
 
 assert sys.version_info.major == 3
 assert sys.version_info.minor == 10
 
-
-class JsAST:
+# str.splitlines boundaries, which is what textwrap.indent splits on
+LINEBREAKS = frozenset("\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
+
+
+class Indent:
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.open = True
+
+
+class Emitter:
+    # one buffer for a whole tree; indentation is applied while writing with
+    # textwrap.indent rules (blank lines stay bare) instead of re-indenting children
+    def __init__(self):
+        self.parts = []
+        self.indents = []
+        # leading whitespace and indent slots of a line that is still blank
+        self.pending = []
+
+    def write(self, text):
+        for piece in text.splitlines(True):
+            if self.pending is None:
+                self.parts.append(piece)
+            elif piece.isspace():
+                self.pending.append(piece)
+            else:
+                self.flush(True)
+                self.parts.append(piece)
+            if piece[-1] in LINEBREAKS:
+                self.flush(False)
+                self.pending = list(self.indents)
+
+    def flush(self, indent):
+        if self.pending is None:
+            return
+        for item in self.pending:
+            if isinstance(item, str):
+                self.parts.append(item)
+            elif indent and item.open:
+                self.parts.append(item.prefix)
+        self.pending = None
+
+    @contextlib.contextmanager
+    def indent(self, prefix):
+        level = Indent(prefix)
+        if self.pending is None:
+            self.pending = []
+        self.pending.append(level)
+        self.indents.append(level)
+        try:
+            yield
+        finally:
+            level.open = False
+            self.indents.pop()
+
+    def mark(self):
+        return len(self.parts)
+
+    def trim(self, mark, chars):
+        # str.rstrip(chars) of whatever was written since mark; chars is never whitespace
+        if self.pending and any(isinstance(item, str) for item in self.pending):
+            return
+        while len(self.parts) > mark:
+            part = self.parts[-1].rstrip(chars)
+            if part:
+                self.parts[-1] = part
+                return
+            self.parts.pop()
+
+    def getvalue(self):
+        self.flush(False)
+        return "".join(self.parts)
+
+
+@functools.cache
+def parse_template(template, fields):
+    # string.Template.safe_substitute split once into (text, field) pairs
+    ret = []
+    text = ""
+    position = 0
+    for match in string.Template.pattern.finditer(template):
+        text += template[position:match.start()]
+        position = match.end()
+        name = match["named"] or match["braced"]
+        if match["escaped"] is not None:
+            text += "$"
+        elif name in fields:
+            ret.append((text, name))
+            text = ""
+        else:
+            text += match.group()
+    ret.append((text + template[position:], None))
+    return tuple(ret)
+
+
+def emit_join(out, separator, nodes):
+    for i, node in enumerate(nodes):
+        if i:
+            out.write(separator)
+        node.emit(out)
+
+
+def emit_body(out, body):
+    # ";\n".join(stmt.rstrip(";") for stmt in body) + ";", indented
+    with out.indent("    "):
+        for i, stmt in enumerate(body):
+            if i:
+                out.write(";\n")
+            mark = out.mark()
+            stmt.emit(out)
+            out.trim(mark, ";")
+        out.write(";")
+
+
+def marked(emit):
+    # statements that came from component source are prefixed with their line for source maps
+    @functools.wraps(emit)
+    def wrapper(self, out):
+        if (line := getattr(self, "source_line", None)) is not None:
+            out.write(f"/*@yolo:{line}*/")
+        emit(self, out)
+    return wrapper
+
+
+class JsMeta(type):
+    def __new__(mcls, name, bases, attrs):
+        # a slot for every field a base doesn't already have, so nodes carry no __dict__
+        if "__slots__" not in attrs:
+            inherited = {slot for base in bases for c in base.__mro__ for slot in getattr(c, "__slots__", ())}
+            attrs["__slots__"] = tuple(f for f in attrs.get("_fields", ()) if f not in inherited)
+        return super().__new__(mcls, name, bases, attrs)
+
+
+class JsAST(metaclass=JsMeta):
+    __slots__ = ("source_line",)
     _template = None
     _symbol = None
     _fields = ()
 
-    def _render_field_value(self, f):
-        ret = getattr(self, f)
-        return ret.render() if isinstance(ret, JsAST) else str(ret)
-
-    def get_mapping(self):
-        return {f: self._render_field_value(f) for f in self._fields}
-
-    def get_template(self):
-        return string.Template(self._template)
+    def __init__(self, *args, **kwargs):
+        # fields by position or name like ast.AST; missing ones are None like optional ast fields
+        kwargs.update(zip(self._fields, args))
+        for field in self._fields:
+            setattr(self, field, kwargs.pop(field, None))
+        if kwargs:
+            raise TypeError(f"{type(self).__name__} got unexpected fields: {', '.join(kwargs)}")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "emit" in vars(cls):
+            cls.emit = marked(vars(cls)["emit"])
+
+    def emit_field(self, out, field):
+        value = getattr(self, field)
+        if isinstance(value, JsAST):
+            value.emit(out)
+        else:
+            out.write(str(value))
 
-    def render(self, indent=None):
+    @marked
+    def emit(self, out):
         if self._symbol:
-            return self._symbol
-        else:
-            return self.get_template().safe_substitute(self.get_mapping())
+            out.write(self._symbol)
+            return
+        for text, field in parse_template(self._template, self._fields):
+            out.write(text)
+            if field is not None:
+                self.emit_field(out, field)
+
+    def render(self):
+        out = Emitter()
+        self.emit(out)
+        return out.getvalue()
 
 
-# class Jsmod(JsAST, ast.mod):
+# class Jsmod(JsAST):
 #     pass
 
 
-class JsModule(JsAST, ast.Module):
+class JsModule(JsAST):
     _fields = "body", "type_ignores"
 
-    def render(self):
-        return ";\n".join(stmt.render() for stmt in self.body)
+    def emit(self, out):
+        emit_join(out, ";\n", self.body)
 
 
-# class JsInteractive(JsAST, ast.Interactive):
+# class JsInteractive(JsAST):
 #     _fields = 'body'
 
-# class JsExpression(JsAST, ast.Expression):
+# class JsExpression(JsAST):
 #     _fields = 'body'
 
-# class JsFunctionType(JsAST, ast.FunctionType):
+# class JsFunctionType(JsAST):
 #     _fields = 'argtypes', 'returns'
 
-# class Jsstmt(JsAST, ast.stmt):
+# class Jsstmt(JsAST):
 #     pass
 
 
-class JsFunctionDef(JsAST, ast.FunctionDef):
+class JsFunctionDef(JsAST):
     _fields = "name", "args", "body", "decorator_list", "returns", "type_comment"
     _template = """function $name($args) {
 $body
 };
     """
 
-    def get_mapping(self):
-        body = ";\n".join(f'{stmt.render().rstrip(";")}' for stmt in self.body) + ";"
-        return {
-            "name": self.name,
-            "args": self.args.render(),
-            "body": textwrap.indent(body, "    "),
-        }
+    def emit_field(self, out, field):
+        if field == "body":
+            emit_body(out, self.body)
+        elif field == "args":
+            self.args.emit(out)
+        else:
+            out.write(str(getattr(self, field)))
 
 
-class MultilineLambda(JsAST, ast.AST):
+class MultilineLambda(JsAST):
     _fields = "args", "body"
     _template = """($args) => {
 $body
 }"""
 
-    def get_mapping(self):
-        body = ";\n".join(f'{stmt.render().rstrip(";")}' for stmt in self.body) + ";"
-        return {
-            "args": self.args.render(),
-            "body": textwrap.indent(body, "    "),
-        }
+    def emit_field(self, out, field):
+        if field == "body":
+            emit_body(out, self.body)
+        else:
+            self.args.emit(out)
 
 
 class JsAsyncFunctionDef(JsFunctionDef):
@@ -98,53 +249,59 @@ $body
     """
 
 
-class JsClassDef(JsAST, ast.ClassDef):
+class JsClassDef(JsAST):
     _fields = "name", "bases", "keywords", "body", "decorator_list"
 
-    def render(self):
-        return f"class {self.name} extends {self.bases[0].render()} {{\n" + "\n".join(
-            f"{textwrap.indent(stmt.render(), '    ').rstrip()}" for stmt in self.body
-        ) + "\n}\n"
+    def emit(self, out):
+        out.write(f"class {self.name} extends ")
+        self.bases[0].emit(out)
+        out.write(" {\n")
+        # methods are stripped of their trailing blank line, so they are rendered on their own
+        out.write("\n".join(textwrap.indent(stmt.render(), "    ").rstrip() for stmt in self.body))
+        out.write("\n}\n")
 
 
-class JsReturn(JsAST, ast.Return):
+class JsReturn(JsAST):
     _fields = ("value",)
     _template = "return $value;"
 
 
-class JsDelete(JsAST, ast.Delete):
+class JsDelete(JsAST):
     _fields = ("targets",)
 
-    def render(self):
-        return "\n".join(f"delete {t.render()}" for t in self.targets)
+    def emit(self, out):
+        for i, target in enumerate(self.targets):
+            out.write("\ndelete " if i else "delete ")
+            target.emit(out)
 
 
-class JsAssign(JsAST, ast.Assign):
+class JsAssign(JsAST):
     _fields = "targets", "value", "type_comment"
 
-    def render(self):
-        left = " = ".join(t.render() for t in self.targets)
-        right = self.value.render()
-        return f"{left} = {right}"
+    def emit(self, out):
+        emit_join(out, " = ", self.targets)
+        out.write(" = ")
+        self.value.emit(out)
 
 
 class Let(JsAssign):
-    def render(self):
-        left = " = ".join(t.render() for t in self.targets)
-        right = self.value.render()
-        return f"let {left} = {right}"
+    def emit(self, out):
+        out.write("let ")
+        emit_join(out, " = ", self.targets)
+        out.write(" = ")
+        self.value.emit(out)
 
 
-class JsAugAssign(JsAST, ast.AugAssign):
+class JsAugAssign(JsAST):
     _fields = "target", "op", "value"
     _template = "$target $op= $value"
 
 
-# class JsAnnAssign(JsAST, ast.AnnAssign):
+# class JsAnnAssign(JsAST):
 #     _fields = 'target', 'annotation', 'value', 'simple'
 
 
-class JsFor(JsAST, ast.For):
+class JsFor(JsAST):
     _fields = "target", "iter", "body", "orelse", "type_comment"
     _template = """
     $iter.forEach(($target) => {
@@ -152,19 +309,18 @@ class JsFor(JsAST, ast.For):
     });
     """
 
-    def get_mapping(self):
-        return {
-            "target": self.target.render(),
-            "iter": self.iter.render(),
-            "body": "\n".join(f"{stmt.render()}" for stmt in self.body),
-        }
+    def emit_field(self, out, field):
+        if field == "body":
+            emit_join(out, "\n", self.body)
+        else:
+            getattr(self, field).emit(out)
 
 
-# class JsAsyncFor(JsAST, ast.AsyncFor):
+# class JsAsyncFor(JsAST):
 #     _fields = 'target', 'iter', 'body', 'orelse', 'type_comment'
 
 
-class JsWhile(JsAST, ast.While):
+class JsWhile(JsAST):
     _fields = "test", "body"  # , 'orelse'
     _template = """
     while ($test) {
@@ -173,7 +329,7 @@ class JsWhile(JsAST, ast.While):
     """
 
 
-class JsIf(JsAST, ast.If):
+class JsIf(JsAST):
     _fields = "test", "body", "orelse"
     _template = """
     if ($test) {
@@ -182,427 +338,427 @@ class JsIf(JsAST, ast.If):
     """
 
     # todo: fix this
-    def render(self):
-        orelse = ""
-        if self.orelse:
-            orelse = (
-                " else {\n"
-                + "\n;".join(stmt.render() for stmt in self.orelse)
-                + "\n}\n"
-            )
-        return self.get_template().safe_substitute(
-            {
-                "test": self.test.render(),
-                "body": ";\n".join(part.render() for part in self.body),
-                "orelse": orelse,
-            }
-        )
-
-
-# class JsWith(JsAST, ast.With):
+    def emit_field(self, out, field):
+        if field == "test":
+            self.test.emit(out)
+        elif field == "body":
+            emit_join(out, ";\n", self.body)
+        elif self.orelse:
+            out.write(" else {\n")
+            emit_join(out, "\n;", self.orelse)
+            out.write("\n}\n")
+
+
+# class JsWith(JsAST):
 #     _fields = 'items', 'body', 'type_comment'
 
 
-# class JsAsyncWith(JsAST, ast.AsyncWith):
+# class JsAsyncWith(JsAST):
 #     _fields = 'items', 'body', 'type_comment'
 
 
-# class JsMatch(JsAST, ast.Match):
+# class JsMatch(JsAST):
 #     _fields = 'subject', 'cases'
 
 
-class JsRaise(JsAST, ast.Raise):
+class JsRaise(JsAST):
     _fields = ("exc",)  # 'cause'
     _template = "throw $exc;"
 
 
-class JsTry(JsAST, ast.Try):
+class JsTry(JsAST):
     _fields = "body", "handlers", "orelse", "finalbody"
 
 
-class JsAssert(JsAST, ast.Assert):
+class JsAssert(JsAST):
     _fields = "test", "msg"
     _template = "assert($test, $msg);"
 
 
-class JsImport(JsAST, ast.Import):
+class JsImport(JsAST):
     _fields = ("names",)
     _template = "import $names;"
 
 
-class JsImportFrom(JsAST, ast.ImportFrom):
+class JsImportFrom(JsAST):
     _fields = "module", "names", "level"
 
 
-# class JsGlobal(JsAST, ast.Global):
+# class JsGlobal(JsAST):
 #     _fields = 'names',
 
 
-# class JsNonlocal(JsAST, ast.Nonlocal):
+# class JsNonlocal(JsAST):
 #     _fields = 'names',
 
 
-class JsExpr(JsAST, ast.Expr):
+class JsExpr(JsAST):
     _fields = ("value",)
     _template = "$value"
 
 
-class JsPass(JsAST, ast.Pass):
+class JsPass(JsAST):
     _template = ""
 
 
-class JsBreak(JsAST, ast.Break):
+class JsBreak(JsAST):
     _template = "break;"
 
 
-class JsContinue(JsAST, ast.Continue):
+class JsContinue(JsAST):
     _template = "continue;"
 
 
-# class Jsexpr(JsAST, ast.expr):
+# class Jsexpr(JsAST):
 #     pass
 
 
-# class JsBoolOp(JsAST, ast.BoolOp):
+# class JsBoolOp(JsAST):
 #     _fields = 'op', 'values'
 
 
-class JsNamedExpr(JsAST, ast.NamedExpr):
+class JsNamedExpr(JsAST):
     _fields = "target", "value"
     _template = "$target = $value"
 
 
-class JsBinOp(JsAST, ast.BinOp):
+class JsBinOp(JsAST):
     _fields = "left", "op", "right"
     _template = "$left $op $right"
 
 
-class JsUnaryOp(JsAST, ast.UnaryOp):
+class JsUnaryOp(JsAST):
     _fields = "op", "operand"
     _template = "$op $operand"
 
-    def get_mapping(self):
-        return {
-            "op": self.op._symbol,
-            "operand": self.operand.render(),
-        }
+    def emit_field(self, out, field):
+        if field == "op":
+            out.write(self.op._symbol)
+        else:
+            self.operand.emit(out)
 
 
-class JsLambda(JsAST, ast.Lambda):
+class JsLambda(JsAST):
     _fields = "args", "body"
     _template = "(($args) => ($body))"
 
 
-class JsIfExp(JsAST, ast.IfExp):
+class JsIfExp(JsAST):
     _fields = "test", "body", "orelse"
     _template = "(($test) ? ($body) : ($orelse))"
 
 
-class JsDict(JsAST, ast.Dict):
+class JsDict(JsAST):
     _fields = "keys", "values"
 
-    def render(self):
-        ret = []
-        for k, v in zip(self.keys, self.values):
-            ret.append(f"{k.render()}: {v.render()}")
-        return "{" + ",".join(ret) + "}"
+    def emit(self, out):
+        out.write("{")
+        for i, (k, v) in enumerate(zip(self.keys, self.values)):
+            if i:
+                out.write(",")
+            k.emit(out)
+            out.write(": ")
+            v.emit(out)
+        out.write("}")
 
 
-class JsSet(JsAST, ast.Set):
+class JsSet(JsAST):
     _fields = ("elts",)
 
 
-class JsListComp(JsAST, ast.ListComp):
+class JsListComp(JsAST):
     _fields = "elt", "generators"
 
 
-class JsSetComp(JsAST, ast.SetComp):
+class JsSetComp(JsAST):
     _fields = "elt", "generators"
 
 
-class JsDictComp(JsAST, ast.DictComp):
+class JsDictComp(JsAST):
     _fields = "key", "value", "generators"
 
 
-class JsGeneratorExp(JsAST, ast.GeneratorExp):
+class JsGeneratorExp(JsAST):
     _fields = "elt", "generators"
 
 
-class JsAwait(JsAST, ast.Await):
+class JsAwait(JsAST):
     _fields = ("value",)
 
 
-class JsYield(JsAST, ast.Yield):
+class JsYield(JsAST):
     _fields = ("value",)
 
 
-class JsYieldFrom(JsAST, ast.YieldFrom):
+class JsYieldFrom(JsAST):
     _fields = ("value",)
 
 
-class JsCompare(JsAST, ast.Compare):
+class JsCompare(JsAST):
     _fields = "left", "ops", "comparators"
 
-    def render(self):
-        ops = [i.render() for i in self.ops]
-        comparators = (i.render() for i in self.comparators)
-        return functools.reduce(
-            lambda left, pair: f"{left} {pair[0]} {pair[1]}",
-            zip(ops, comparators),
-            self.left.render(),
-        )
+    def emit(self, out):
+        self.left.emit(out)
+        for op, comparator in zip(self.ops, self.comparators):
+            out.write(" ")
+            op.emit(out)
+            out.write(" ")
+            comparator.emit(out)
 
 
-class JsCall(JsAST, ast.Call):
+class JsCall(JsAST):
     _fields = "func", "args", "keywords"
 
-    def render(self):
-        args = ", ".join(
-            itertools.chain(
-                (a.render() for a in self.args), (kw.render() for kw in self.keywords)
-            )
-        )
-        return f"{self.func.render()}({args})"
+    def emit(self, out):
+        self.func.emit(out)
+        out.write("(")
+        emit_join(out, ", ", [*self.args, *self.keywords])
+        out.write(")")
 
 
 class IIFE(JsCall):
     _fields = "func", "args", "keywords"
 
-    def render(self):
-        args = ", ".join(
-            itertools.chain(
-                (a.render() for a in self.args), (kw.render() for kw in self.keywords)
-            )
-        )
-        return f"({self.func.render().strip()})({args.strip()})"
+    def emit(self, out):
+        out.write("(")
+        # a multiline lambda has no surrounding whitespace to strip, so it goes straight to the buffer
+        if isinstance(self.func, MultilineLambda):
+            self.func.emit(out)
+        else:
+            out.write(self.func.render().strip())
+        args = ", ".join(a.render() for a in [*self.args, *self.keywords])
+        out.write(f")({args.strip()})")
 
 
-class JsFormattedValue(JsAST, ast.FormattedValue):
+class JsFormattedValue(JsAST):
     _fields = "value", "conversion", "format_spec"
 
-    def render(self):
-        return self.value.render()
+    def emit(self, out):
+        self.value.emit(out)
 
 
-class JsJoinedStr(JsAST, ast.JoinedStr):
+class JsJoinedStr(JsAST):
     _fields = ("values",)
 
-    def render(self):
-        value = ", ".join(v.render() for v in self.values)
-        return "[" + value + '].join("")'
+    def emit(self, out):
+        out.write("[")
+        emit_join(out, ", ", self.values)
+        out.write('].join("")')
 
 
-class JsConstant(JsAST, ast.Constant):
+class JsConstant(JsAST):
     _fields = "value", "kind"
 
-    def render(self):
+    def emit(self, out):
         if self.value is None:
-            return "null"
-        if self.value is True:
-            return "true"
-        if self.value is False:
-            return "false"
-        return f'"{self.value}"' if isinstance(self.value, str) else str(self.value)
+            out.write("null")
+        elif self.value is True:
+            out.write("true")
+        elif self.value is False:
+            out.write("false")
+        else:
+            out.write(f'"{self.value}"' if isinstance(self.value, str) else str(self.value))
 
 
 class MultilineConstant(JsConstant):
-    def render(self):
+    def emit(self, out):
         value = textwrap.dedent('\n' + str(self.value))
-        return f'`{value}`'
+        out.write(f'`{value}`')
 
 
-class JsAttribute(JsAST, ast.Attribute):
+class JsAttribute(JsAST):
     _fields = "value", "attr"  # , 'ctx'
     _template = "$value.$attr"
 
 
-class JsSubscript(JsAST, ast.Subscript):
+class JsSubscript(JsAST):
     _fields = "value", "slice"  # , 'ctx'
     _template = "$value[$slice]"
 
 
-class JsStarred(JsAST, ast.Starred):
+class JsStarred(JsAST):
     _fields = ("value",)  # 'ctx'
     _template = "...$value"
 
 
-class JsName(JsAST, ast.Name):
+class JsName(JsAST):
     _fields = ("id",)  # 'ctx'
 
-    def render(self):
-        return str(self.id)
+    def emit(self, out):
+        out.write(str(self.id))
 
 
-class JsList(JsAST, ast.List):
+class JsList(JsAST):
     _fields = ("elts",)  # 'ctx'
 
-    def render(self):
-        elts = ", ".join(e.render() for e in self.elts)
-        return f"[{elts}]"
+    def emit(self, out):
+        out.write("[")
+        emit_join(out, ", ", self.elts)
+        out.write("]")
 
 
 class JsTuple(JsList):
     pass
 
 
-class JsSlice(JsAST, ast.Slice):
+class JsSlice(JsAST):
     _fields = "lower", "upper", "step"
 
 
-# class Jsexpr_context(JsAST, ast.expr_context):
+# class Jsexpr_context(JsAST):
 #     pass
 
-# class JsLoad(JsAST, ast.Load):
+# class JsLoad(JsAST):
 #     pass
 
-# class JsStore(JsAST, ast.Store):
+# class JsStore(JsAST):
 #     pass
 
-# class JsDel(JsAST, ast.Del):
+# class JsDel(JsAST):
 #     pass
 
-# class Jsboolop(JsAST, ast.boolop):
+# class Jsboolop(JsAST):
 #     pass
 
 
-class JsAnd(JsAST, ast.And):
+class JsAnd(JsAST):
     pass
 
 
-class JsOr(JsAST, ast.Or):
+class JsOr(JsAST):
     pass
 
 
-# class Jsoperator(JsAST, ast.operator):
+# class Jsoperator(JsAST):
 #     pass
 
 
-class JsAdd(JsAST, ast.Add):
+class JsAdd(JsAST):
     _symbol = "+"
 
 
-class JsSub(JsAST, ast.Sub):
+class JsSub(JsAST):
     _symbol = "-"
 
 
-class JsMult(JsAST, ast.Mult):
+class JsMult(JsAST):
     _symbol = "*"
 
 
-# class JsMatMult(JsAST, ast.MatMult):
+# class JsMatMult(JsAST):
 #     pass
 
 
-class JsDiv(JsAST, ast.Div):
+class JsDiv(JsAST):
     _symbol = "/"
 
 
-class JsMod(JsAST, ast.Mod):
+class JsMod(JsAST):
     _symbol = "%"
 
 
-# class JsPow(JsAST, ast.Pow):
+# class JsPow(JsAST):
 #     pass
 
 
-class JsLShift(JsAST, ast.LShift):
+class JsLShift(JsAST):
     _symbol = "<<"
 
 
-class JsRShift(JsAST, ast.RShift):
+class JsRShift(JsAST):
     _symbol = ">>"
 
 
-class JsBitOr(JsAST, ast.BitOr):
+class JsBitOr(JsAST):
     _symbol = "|"
 
 
-class JsBitXor(JsAST, ast.BitXor):
+class JsBitXor(JsAST):
     _symbol = "^"
 
 
-class JsBitAnd(JsAST, ast.BitAnd):
+class JsBitAnd(JsAST):
     _symbol = "&"
 
 
-# class JsFloorDiv(JsAST, ast.FloorDiv):
+# class JsFloorDiv(JsAST):
 #     pass
 
-# class Jsunaryop(JsAST, ast.unaryop):
+# class Jsunaryop(JsAST):
 #     pass
 
-# class JsInvert(JsAST, ast.Invert):
+# class JsInvert(JsAST):
 #     pass
 
 
-class JsNot(JsAST, ast.Not):
+class JsNot(JsAST):
     _symbol = "!"
 
 
-class JsUAdd(JsAST, ast.UAdd):
+class JsUAdd(JsAST):
     _symbol = "+"
 
 
-class JsUSub(JsAST, ast.USub):
+class JsUSub(JsAST):
     _symbol = "-"
 
 
-# class Jscmpop(JsAST, ast.cmpop):
+# class Jscmpop(JsAST):
 #     pass
 
 
-class JsEq(JsAST, ast.Eq):
+class JsEq(JsAST):
     _template = "=="
 
 
-class JsNotEq(JsAST, ast.NotEq):
+class JsNotEq(JsAST):
     _template = "!="
 
 
-class JsLt(JsAST, ast.Lt):
+class JsLt(JsAST):
     _template = "<"
 
 
-class JsLtE(JsAST, ast.LtE):
+class JsLtE(JsAST):
     pass
 
 
-class JsGt(JsAST, ast.Gt):
+class JsGt(JsAST):
     _template = ">"
 
 
-class JsGtE(JsAST, ast.GtE):
+class JsGtE(JsAST):
     pass
 
 
-class JsIs(JsAST, ast.Is):
+class JsIs(JsAST):
     _template = "==="
 
 
-class JsIsNot(JsAST, ast.IsNot):
+class JsIsNot(JsAST):
     _template = "!=="
 
 
-# class JsIn(JsAST, ast.In):
+# class JsIn(JsAST):
 #     _fields =
 
-# class JsNotIn(JsAST, ast.NotIn):
+# class JsNotIn(JsAST):
 #     _fields =
 
 
-class Jscomprehension(JsAST, ast.comprehension):
+class Jscomprehension(JsAST):
     _fields = "target", "iter", "ifs", "is_async"
 
 
-# class Jsexcepthandler(JsAST, ast.excepthandler):
+# class Jsexcepthandler(JsAST):
 #     _fields =
 
 
-class JsExceptHandler(JsAST, ast.ExceptHandler):
+class JsExceptHandler(JsAST):
     _fields = "type", "name", "body"
 
 
-class Jsarguments(JsAST, ast.arguments):
+class Jsarguments(JsAST):
     _fields = (
         "posonlyargs",
         "args",
@@ -613,136 +769,136 @@ class Jsarguments(JsAST, ast.arguments):
         "defaults",
     )
 
-    def render(self):
+    def emit(self, out):
         assert self.kwarg is None, self.kwarg.render()
         assert self.defaults == [], self.defaults
-        args = [
-            *(arg.render() for arg in itertools.chain(self.posonlyargs, self.args)),
-            *(
-                f"{k.render()}={v.render()}"
-                for k, v in zip(self.kwonlyargs, self.kw_defaults)
-            ),
-        ]
+        positional = [*self.posonlyargs, *self.args]
+        keywords = list(zip(self.kwonlyargs, self.kw_defaults))
+        emit_join(out, ", ", positional)
+        for i, (k, v) in enumerate(keywords):
+            if i or positional:
+                out.write(", ")
+            k.emit(out)
+            out.write("=")
+            v.emit(out)
         if self.vararg:
-            args.append(f"...{self.vararg.render()}")
-        if not args:
-            return ""
-        elif len(args) == 1:
-            return args[0]
-        else:
-            return ", ".join(args)
+            if positional or keywords:
+                out.write(", ")
+            out.write("...")
+            self.vararg.emit(out)
 
 
-class Jsarg(JsAST, ast.arg):
+class Jsarg(JsAST):
     _fields = "arg", "annotation", "type_comment"
 
-    def render(self):
-        return self.arg
+    def emit(self, out):
+        out.write(self.arg)
 
 
-class Jskeyword(JsAST, ast.keyword):
+class Jskeyword(JsAST):
     _fields = "arg", "value"
 
-    def render(self):
-        return f"{self.arg}={self.value.render()}"
+    def emit(self, out):
+        out.write(f"{self.arg}=")
+        self.value.emit(out)
 
 
-class Jsalias(JsAST, ast.alias):
+class Jsalias(JsAST):
     _fields = "name", "asname"
 
 
-class Jswithitem(JsAST, ast.withitem):
+class Jswithitem(JsAST):
     _fields = "context_expr", "optional_vars"
 
 
-class Jsmatch_case(JsAST, ast.match_case):
+class Jsmatch_case(JsAST):
     _fields = "pattern", "guard", "body"
 
 
-# class Jspattern(JsAST, ast.pattern):
+# class Jspattern(JsAST):
 #     pass
 
 
-class JsMatchValue(JsAST, ast.MatchValue):
+class JsMatchValue(JsAST):
     _fields = ("value",)
 
 
-class JsMatchSingleton(JsAST, ast.MatchSingleton):
+class JsMatchSingleton(JsAST):
     _fields = ("value",)
 
 
-class JsMatchSequence(JsAST, ast.MatchSequence):
+class JsMatchSequence(JsAST):
     _fields = ("patterns",)
 
 
-class JsMatchMapping(JsAST, ast.MatchMapping):
+class JsMatchMapping(JsAST):
     _fields = "keys", "patterns", "rest"
 
 
-class JsMatchClass(JsAST, ast.MatchClass):
+class JsMatchClass(JsAST):
     _fields = "cls", "patterns", "kwd_attrs", "kwd_patterns"
 
 
-class JsMatchStar(JsAST, ast.MatchStar):
+class JsMatchStar(JsAST):
     _fields = ("name",)
 
 
-class JsMatchAs(JsAST, ast.MatchAs):
+class JsMatchAs(JsAST):
     _fields = "pattern", "name"
 
 
-class JsMatchOr(JsAST, ast.MatchOr):
+class JsMatchOr(JsAST):
     _fields = ("patterns",)
 
 
-# class Jstype_ignore(JsAST, ast.type_ignore):
+# class Jstype_ignore(JsAST):
 #     pass
 
 
-class JsTypeIgnore(JsAST, ast.TypeIgnore):
+class JsTypeIgnore(JsAST):
     _fields = "lineno", "tag"
 
 
-class JsNum(JsAST, ast.Num):
+class JsNum(JsAST):
     _fields = ("n",)
 
 
-class JsStr(JsAST, ast.Str):
+class JsStr(JsAST):
     _fields = ("s",)
 
 
-class JsBytes(JsAST, ast.Bytes):
+class JsBytes(JsAST):
     _fields = ("s",)
 
 
-class JsNameConstant(JsAST, ast.NameConstant):
+class JsNameConstant(JsAST):
     _fields = "value", "kind"
 
 
-# class JsEllipsis(JsAST, ast.Ellipsis):
+# class JsEllipsis(JsAST):
 #     pass
 
-# class Jsslice(JsAST, ast.slice):
+# class Jsslice(JsAST):
 #     pass
 
 
-class JsIndex(JsAST, ast.Index):
+class JsIndex(JsAST):
     pass
 
 
-# class JsExtSlice(JsAST, ast.ExtSlice):
+# class JsExtSlice(JsAST):
 #     pass
 
-# class JsSuite(JsAST, ast.Suite):
+# class JsSuite(JsAST):
 #     pass
 
-# class JsAugLoad(JsAST, ast.AugLoad):
+# class JsAugLoad(JsAST):
 #     pass
 
-# class JsAugStore(JsAST, ast.AugStore):
+# class JsAugStore(JsAST):
 #     pass
 
-# class JsParam(JsAST, ast.Param):
+# class JsParam(JsAST):
 #     pass
 
 TABLE = (
@@ -843,34 +999,38 @@ TABLE = (
 )
 
 
-class With(JsAST, ast.With):
+class With(JsAST):
     _fields = "items", "body", "type_comment"
 
 
-class FormatContent(JsAST, ast.JoinedStr):
+class FormatContent(JsAST):
     _fields = ("values",)
 
-    def render(self):
-        values = list(
-            f'"{value.value}"'
-            if isinstance(value, JsConstant)
-            else f"String({value.render()})"
-            for value in self.values
-        )
-        if len(values) > 1:
-            return "this._text([" + ", ".join(values) + '].join(""))'
-        return f"this._text({values[0]})"
-
-
-class FormatExprContent(JsAST, ast.FormattedValue):
+    def emit(self, out):
+        out.write("this._text([" if len(self.values) > 1 else "this._text(")
+        for i, value in enumerate(self.values):
+            if i:
+                out.write(", ")
+            if isinstance(value, JsConstant):
+                out.write(f'"{value.value}"')
+            else:
+                out.write("String(")
+                value.emit(out)
+                out.write(")")
+        out.write('].join(""))' if len(self.values) > 1 else ")")
+
+
+class FormatExprContent(JsAST):
     _fields = "value", "conversion", "format_spec"
 
-    def render(self):
-        return self.value.render()
+    def emit(self, out):
+        self.value.emit(out)
 
 
-class AssignAttribute(JsAST, ast.AnnAssign):
+class AssignAttribute(JsAST):
     _fields = "target", "annotation", "value", "simple"
 
-    def render(self):
-        return f'{self.target.id}.setAttribute("{self.annotation.id}", {self.value.render()})'
+    def emit(self, out):
+        out.write(f'{self.target.id}.setAttribute("{self.annotation.id}", ')
+        self.value.emit(out)
+        out.write(")")
@@ -1,22 +1,29 @@
+import re
 import ast
 import uuid
 import hashlib
 import inspect
 import textwrap
+import html
 import html.parser
 import string
+import operator
+import functools
+import collections
 
 from yoloboros.grammar import syntax as grammar
-from yoloboros import constants
+from yoloboros import constants, profiler, ssr
 
 
 class HTMLRenderer(html.parser.HTMLParser):
+    ESCAPE = str.maketrans({'"': "'", ' ': '&nbsp;', '<': '&lt;', '>': '&gt;', '\n': '<br>'})
+
     def __init__(self):
         super().__init__()
-        self.result = ''
+        self.result = []
 
     def handle_starttag(self, tag, attrs):
-        self.result += f'<{tag} {self._attrs(attrs)}>'
+        self.result.append(f'<{tag} {self._attrs(attrs)}>')
 
     def _attrs(self, attrs):
         ret = []
@@ -29,56 +36,104 @@ class HTMLRenderer(html.parser.HTMLParser):
         return ' '.join(ret)
 
     def handle_endtag(self, tag):
-        self.result += f'</{tag}>'
+        self.result.append(f'</{tag}>')
 
     def handle_data(self, data):
-        self.result += (
-            data.replace('"', "'")
-            .replace(" ", "&nbsp;").replace("<", "&lt;")
-            .replace(">", "&gt;").replace("\n", "<br>")
-        )
+        self.result.append(data.translate(self.ESCAPE))
 
     @classmethod
-    def render(self, value):
-        renderer = HTMLRenderer()
+    @functools.lru_cache(maxsize=4096)
+    def render(cls, value):
+        renderer = cls()
         renderer.feed(textwrap.dedent(value))
-        return renderer.result
+        return ''.join(renderer.result)
 
 
 def tag_children(node):
-    for child in ast.iter_child_nodes(node):
-        child.parent = node
-        for attr in node._fields:
-            if isinstance(getattr(node, attr), list) and child in getattr(node, attr):
-                child.parent_attr = attr
-                child.parent_attr_idx = getattr(node, attr).index(child)
-            elif child == getattr(node, attr):
-                child.parent_attr = attr
-                child.parent_attr_idx = None
+    # one breadth-first pass; the parent slots of `...` placeholders come back in ast.walk order
+    placeholders = []
+    queue = collections.deque([node])
+    while queue:
+        parent = queue.popleft()
+        for attr, value in ast.iter_fields(parent):
+            for idx, child in enumerate(value) if isinstance(value, list) else [(None, value)]:
+                if isinstance(child, ast.AST):
+                    child.parent, child.parent_attr, child.parent_attr_idx = parent, attr, idx
+                    if isinstance(child, ast.Constant) and child.value is Ellipsis:
+                        placeholders.append((parent, attr, idx))
+                    queue.append(child)
+    return placeholders
+
+
+def builder(tree, slots):
+    # source that rebuilds tree with plain constructor calls, naming the placeholders' parents
+    parents = {id(parent): f'p{i}' for i, (parent, _, _) in enumerate(slots)}
+    values = []
+
+    def build(node):
+        if isinstance(node, list):
+            return '[' + ', '.join(map(build, node)) + ']'
+        if not isinstance(node, ast.AST):
+            values.append(node)
+            return f'v[{len(values) - 1}]'
+        fields = [*ast.iter_fields(node), *((a, getattr(node, a)) for a in node._attributes if hasattr(node, a))]
+        ret = f'ast.{type(node).__name__}(' + ', '.join(f'{k}={build(v)}' for k, v in fields) + ')'
+        return f'({parents[id(node)]} := {ret})' if id(node) in parents else ret
+
+    body = build(tree)
+    slots = ', '.join(f'({parents[id(parent)]}, {attr!r}, {idx!r})' for parent, attr, idx in slots)
+    ns = {'ast': ast, 'v': values}
+    exec(f'def builder():\n    return {body}, [{slots}]', ns)
+    return ns['builder']
+
+
+class Template:
+    def __init__(self, value):
+        self.value = value
+        self.builder = None
+        self.used = False
 
-        tag_children(child)
+    def __call__(self):
+        # a fresh tree and the parent slots of its placeholders; templates that come back
+        # get a builder, so one-off templates don't pay for compiling it
+        if self.builder is not None:
+            return self.builder()
+        tree = profiler.measure('parse', ast.parse, self.value)
+        slots = profiler.measure('tag_children', tag_children, tree)
+        if self.used:
+            self.builder = profiler.measure('builder', builder, tree, slots)
+        self.used = True
+        return tree, slots
+
+
+@functools.lru_cache(maxsize=1024)
+def template(value):
+    return Template(value)
 
 
 class Node:
     def __init__(self, value, **kwargs):
-        self.value = ast.parse(value)
-        tag_children(self.value)
+        self.value, placeholders = profiler.measure('copy', template(value))
+        self.placeholders = collections.deque(placeholders)
         self.kwargs = kwargs
 
     def replace(self, replacement, target=None):
-        if target is not None:
+        if target is None:
+            parent, attr, idx = self.placeholders.popleft()
+        else:
             replacement, target = target, replacement
-        elif target is None:
-            target = lambda x: isinstance(x, ast.Ellipsis)
-
-        if not callable(target):
-            target = lambda x: x == target
-
-        node = next(i for i in ast.walk(self.value) if target(i))
-        if node.parent_attr_idx is not None:
-            getattr(node.parent, node.parent_attr)[node.parent_attr_idx] = replacement
+            if not callable(target):
+                target = functools.partial(operator.eq, target)
+            tag_children(self.value)
+            node = next(i for i in ast.walk(self.value) if target(i))
+            parent, attr, idx = node.parent, node.parent_attr, node.parent_attr_idx
+            if (parent, attr, idx) in self.placeholders:
+                self.placeholders.remove((parent, attr, idx))
+
+        if idx is None:
+            setattr(parent, attr, replacement)
         else:
-            setattr(node.parent, node.parent_attr, replacement)
+            getattr(parent, attr)[idx] = replacement
 
     def __call__(self, *args, **kwargs):
         self.replace(*args, **kwargs)
@@ -96,6 +151,9 @@ class Node:
     def render(self):
         return self.as_js().render()
 
+    def emit(self, out):
+        self.as_js().emit(out)
+
     def val(self):
         return self.value
 
@@ -136,7 +194,8 @@ class Node:
 
     @classmethod
     def f(self, **kwargs):
-        return ast.FunctionDef(
+        func = ast.AsyncFunctionDef if kwargs.get('is_async') else ast.FunctionDef
+        return func(
             name=kwargs['name'],
             args=kwargs.get('args', []),
             body=kwargs['body'],
@@ -173,6 +232,37 @@ def pyodidize(body, locals=None, globals=None):
     return call(func=_('pyodide.runPython').val(), args=args)
 
 
+def merge_text(body):
+    # adjacent text literals become one __yolo__text call
+    merged = []
+    for stmt in body:
+        match stmt, merged:
+            case (ast.Expr(ast.Constant(str()) | ast.JoinedStr() as value),
+                  [*_, ast.Expr(ast.Constant(str()) | ast.JoinedStr() as previous)]):
+                values = [
+                    part for v in (previous, value)
+                    for part in (v.values if isinstance(v, ast.JoinedStr) else [v])
+                ]
+                merged[-1].value = ast.JoinedStr(values)
+            case _:
+                merged.append(stmt)
+    return merged
+
+
+def anchor(component, node):
+    name = f'{component.__module__}.{component.__qualname__}:{component.identifier}'
+    ret = uuid.uuid5(uuid.NAMESPACE_OID, f'{name}:{node.lineno}:{node.col_offset}')
+    return ret.hex[:12] if component.app().minify else str(ret)
+
+
+def define(source):
+    ns = {}
+    profiler.measure('exec', exec, source, ns)
+    func = ns.popitem()[1]
+    setattr(func, '__src', source)
+    return func
+
+
 def call(**kwargs):
     return ast.Call(
         func=kwargs['func'],
@@ -192,16 +282,19 @@ class BaseRenderer(ast.NodeTransformer):
 
     def walk(self):
         if isinstance(self.value, str):
-            obj = ast.parse(self.value)
-        elif isinstance(self.value, ast.AST):
+            obj = profiler.measure('parse', ast.parse, self.value)
+        elif isinstance(self.value, (ast.AST, grammar.JsAST)):
             obj = self.value
         else:
-            obj = textwrap.dedent(inspect.getsource(self.value))
+            obj = textwrap.dedent(profiler.measure('getsource', inspect.getsource, self.value))
             stripped = obj.lstrip(" ")
             if stripped != obj:
                 obj = stripped.replace("\n    ", "\n")
-            obj = ast.parse(obj)
-        return self.visit(obj)
+            obj = profiler.measure('parse', ast.parse, obj)
+            for node in ast.walk(obj):
+                if isinstance(node, ast.stmt):
+                    node.source_line = node.lineno
+        return profiler.measure(f'{type(self).__name__}.walk', self.visit, obj)
 
     def get_source(self, obj):
         try:
@@ -225,35 +318,94 @@ class JsTranslator(BaseRenderer):
         if target_node := self.mapping.get(type(node)):
             if fields := target_node._fields:
                 attrs = {f: self.visit(getattr(node, f)) for f in fields}
-                return target_node(**attrs)
+                ret = target_node(**attrs)
             else:
-                return target_node()
+                ret = target_node()
+            if (line := getattr(node, 'source_line', None)) is not None:
+                ret.source_line = line
+            return ret
         else:
             return self._visit_special(node)
 
 
+# tags the html parser moves, drops or rewrites wherever they are, so they never go into a template
+UNPARSEABLE = {
+    'table', 'caption', 'colgroup', 'col', 'thead', 'tbody', 'tfoot', 'tr', 'td', 'th',
+    'select', 'option', 'optgroup', 'form', 'nobr', 'image', 'rb', 'rp', 'rt', 'rtc',
+    'html', 'head', 'body', 'frameset', 'frame', 'template', 'svg', 'math',
+    'script', 'style', 'textarea', 'title', 'xmp', 'iframe', 'noembed', 'noframes', 'noscript', 'plaintext',
+}
+HEADINGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+# descendants whose start tag makes the parser close the enclosing tag early
+CLOSES = {
+    'p': {
+        'address', 'article', 'aside', 'blockquote', 'center', 'details', 'dialog', 'dir', 'div', 'dl',
+        'fieldset', 'figcaption', 'figure', 'footer', 'header', 'hgroup', 'main', 'menu', 'nav', 'ol', 'p',
+        'search', 'section', 'summary', 'ul', 'pre', 'listing', 'li', 'dd', 'dt', 'hr', *HEADINGS,
+    },
+    'a': {'a'},
+    'button': {'button'},
+    'li': {'li'},
+    'dd': {'dd', 'dt'},
+    'dt': {'dd', 'dt'},
+    **{h: HEADINGS for h in HEADINGS},
+}
+# lists stop the search for an open item, so nested lists are fine
+SCOPES = {'ul': {'li'}, 'ol': {'li'}, 'menu': {'li'}, 'dl': {'dd', 'dt'}}
+
+
+def markup_tags(text):
+    # tags a text literal writes, None when they don't close inside it or the parser would move them
+    stack, tags = [], set()
+    for closing, tag in re.findall(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)', text):
+        tag = tag.lower()
+        if closing:
+            if not stack or stack.pop() != tag:
+                return None
+        elif tag not in ssr.VOID:
+            stack.append(tag)
+        tags.add(tag)
+    return None if stack or tags & UNPARSEABLE else tags
+
+
 class NodeRenderer(BaseRenderer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.with_stack = []
+        self.conditional = 0
+        self.statics = {}
 
     def visit_Expr(self, node):
         match node:
             case ast.Expr(ast.Constant(str(value))):
-                const = ast.Constant(HTMLRenderer().render(value))
-                return _(f'{constants.COMPONENT_TEXT}(current, ...)')(const).val()
+                const = ast.Constant(HTMLRenderer.render(value))
+                ret = _(f'{constants.COMPONENT_TEXT}(current, ...)')(const).val()
             case ast.Expr(ast.JoinedStr(value)):
                 for i, v in enumerate(value):
                     if isinstance(v, ast.Constant):
-                        value[i].value = HTMLRenderer().render(v.value)
-                return _(f'{constants.COMPONENT_TEXT}(current, ...)')(ast.JoinedStr(value)).val()
+                        value[i].value = HTMLRenderer.render(v.value)
+                ret = _(f'{constants.COMPONENT_TEXT}(current, ...)')(ast.JoinedStr(value)).val()
             case _:
                 return node
+        if (line := getattr(node, 'source_line', None)) is not None:
+            ret.source_line = line
+        return ret
+
+    def generic_visit(self, node):
+        for field in ('body', 'orelse', 'finalbody'):
+            if isinstance(getattr(node, field, None), list):
+                setattr(node, field, merge_text(getattr(node, field)))
+        if isinstance(node, (ast.If, ast.For, ast.While, ast.Try, ast.Match)):
+            self.conditional += 1
+            ret = super().generic_visit(node)
+            self.conditional -= 1
+            return ret
+        return super().generic_visit(node)
 
     def visit_FunctionDef(self, node):
         if node.name == "render":
             node.name = constants.COMPONENT_RENDER
-            node.body = [self.visit(stmt) for stmt in node.body]
+            node.body = [self.visit(stmt) for stmt in merge_text(node.body)]
             node.args.args += [ast.keyword(arg="current", value=ast.Constant(None))]
             return node
         else:
@@ -263,12 +415,18 @@ class NodeRenderer(BaseRenderer):
             )
 
     def visit_AsyncFunctionDef(self, node):
+        if node.name == "render":
+            # async render only allows awaits in inlined server sections
+            node = ast.FunctionDef(**{f: getattr(node, f) for f in node._fields})
         return self.visit_FunctionDef(node)
 
     def visit_With(self, node):
         self.with_stack.append(node)
         ret = self._visit_With(node)
         self.with_stack.pop()
+        if (line := getattr(node, 'source_line', None)) is not None:
+            for target in (ret.body if isinstance(ret, ast.Module) else [ret]):
+                target.source_line = line
         return ret
 
     def inlined_with(self, node):
@@ -308,6 +466,64 @@ class NodeRenderer(BaseRenderer):
     def process_optional_vars(self, node, name):
         pass
 
+    def static(self, node, components):
+        # markup of a subtree made only of plain tags, constant attributes and text, else None
+        ret = self.static_tree(node, components)
+        return ret and ret[0]
+
+    def static_tree(self, node, components):
+        # every level of `with` asks about its subtree again, so each node is looked at once
+        if node not in self.statics:
+            self.statics[node] = self._static_tree(node, components)
+        return self.statics[node]
+
+    def _static_tree(self, node, components):
+        match node:
+            case ast.With(items=[ast.withitem(context_expr=ast.Name(id=tag), optional_vars=None)]):
+                keywords = []
+            case ast.With(items=[ast.withitem(
+                context_expr=ast.Call(func=ast.Name(id=tag), args=[], keywords=keywords),
+                optional_vars=None,
+            )]):
+                pass
+            case _:
+                return None
+        if tag in components or tag[0] in string.ascii_uppercase or tag in UNPARSEABLE:
+            return None
+
+        attrs = []
+        for keyword in keywords:
+            match keyword:
+                case ast.keyword(arg=str(key), value=ast.Constant(str(value) | int(value))) \
+                        if key not in ('style', 'html') and not isinstance(value, bool):
+                    attrs.append(f" {key}='{html.escape(ssr.string(value))}'")
+                case _:
+                    return None
+
+        content, tags = [], set()
+        for stmt in node.body:
+            match stmt:
+                case ast.Pass():
+                    pass
+                case ast.Expr(ast.Constant(str(value))):
+                    text = HTMLRenderer.render(value)
+                    if (inner := markup_tags(text)) is None:
+                        return None
+                    content.append(text)
+                    tags |= inner
+                case ast.With() if (child := self.static_tree(stmt, components)) is not None:
+                    content.append(child[0])
+                    tags |= child[1]
+                case _:
+                    return None
+        # the parser would not nest these the way createElement does
+        if tags & CLOSES.get(tag, set()):
+            return None
+        tags = (tags - SCOPES.get(tag, set())) | {tag}
+        if tag in ssr.VOID:
+            return None if content else (f'<{tag}{"".join(attrs)}>', tags)
+        return f'<{tag}{"".join(attrs)}>{"".join(content)}</{tag}>', tags
+
     def _visit_With(self, node):
         if len(node.items) > 1:
             nested = ast.With(items=node.items[1:], body=node.body)
@@ -315,7 +531,17 @@ class NodeRenderer(BaseRenderer):
             node.body = [nested]
             return self.visit(node)
 
-        components = [c.__name__ for c in self.namespace['app']().component.registry.values()]
+        components = [c.__name__ for c in self.namespace['app'].component.registry.values()]
+        if (markup := self.static(node, components)) is not None:
+            return grammar.JsCall(
+                func=grammar.JsName(id=constants.COMPONENT_STATIC),
+                args=[
+                    grammar.JsConstant(markup),
+                    grammar.JsConstant(anchor(self.namespace['component'], node.items[0].context_expr)),
+                    grammar.JsName(id="current"),
+                ],
+                keywords=[],
+            )
         bindings = [getattr(w.items[0].optional_vars, 'id', None) for w in self.with_stack[:-1]]
         react_component = None
 
@@ -366,9 +592,12 @@ class NodeRenderer(BaseRenderer):
                 attrs = grammar.JsConstant(None)
                 tag = item.context_expr.id
 
+        if tag.startswith('yolo:') and not self.conditional:
+            self.namespace.setdefault('children', set()).add(tag[5:])
+
         lambda_ = grammar.MultilineLambda(
             args=_.js_a(args=[grammar.JsName(id="current")]),
-            body=[JsTranslator(self.visit(stmt)).walk() for stmt in node.body],
+            body=[JsTranslator(self.visit(stmt)).walk() for stmt in merge_text(node.body)],
         )
 
         body = [
@@ -376,7 +605,7 @@ class NodeRenderer(BaseRenderer):
                 func=grammar.JsName(id=constants.COMPONENT_NODE_CREATE),
                 args=[
                     grammar.JsConstant(tag),
-                    grammar.JsConstant(str(uuid.uuid4())),
+                    grammar.JsConstant(anchor(self.namespace['component'], item.context_expr)),
                     attrs,
                     grammar.JsName(id="current"),
                     (_(f'{{"{react_component}": {react_component}}}')
@@ -423,6 +652,108 @@ class NodeRenderer(BaseRenderer):
         )
 
 
+class ServerRenderer(BaseRenderer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.with_stack = []
+
+    def visit_body(self, body):
+        ret = []
+        for stmt in body:
+            stmt = self.visit(stmt)
+            if isinstance(stmt, list):
+                ret.extend(stmt)
+            elif stmt is not None:
+                ret.append(stmt)
+        return ret or [ast.Pass()]
+
+    def generic_visit(self, node):
+        for field in ('body', 'orelse', 'finalbody'):
+            if isinstance(getattr(node, field, None), list) and getattr(node, field):
+                setattr(node, field, self.visit_body(getattr(node, field)))
+        for handler in getattr(node, 'handlers', ()):
+            handler.body = self.visit_body(handler.body)
+        for case in getattr(node, 'cases', ()):
+            case.body = self.visit_body(case.body)
+        return node
+
+    def visit_FunctionDef(self, node):
+        if node.name != "render":
+            return node
+        return ast.FunctionDef(
+            name="render",
+            args=_.a(args=[ast.arg(arg="self"), ast.arg(arg="html")]),
+            body=[*self.visit_body(node.body), _('yield from ()').val().body[0]],
+            decorator_list=[],
+        )
+
+    def visit_AsyncFunctionDef(self, node):
+        return self.visit_FunctionDef(node)
+
+    def visit_AnnAssign(self, node):
+        # attributes are set by the client while hydrating
+        return None
+
+    def visit_Expr(self, node):
+        match node:
+            case ast.Expr(ast.Constant(str(value))):
+                return _('yield ...')(ast.Constant(HTMLRenderer.render(value))).val().body[0]
+            case ast.Expr(ast.JoinedStr(value)):
+                values = [
+                    ast.Constant(HTMLRenderer.render(v.value)) if isinstance(v, ast.Constant) else v.value
+                    for v in value
+                ]
+                return _('yield html.join(...)')(ast.List(elts=values)).val().body[0]
+            case _:
+                return node
+
+    def visit_With(self, node):
+        if len(node.items) > 1:
+            nested = ast.With(items=node.items[1:], body=node.body)
+            node.items = node.items[:1]
+            node.body = [nested]
+
+        self.with_stack.append(node)
+        ret = self._visit_With(node)
+        self.with_stack.pop()
+        return ret
+
+    def _visit_With(self, node):
+        components = [c.__name__ for c in self.namespace['app'].component.registry.values()]
+        bindings = [getattr(w.items[0].optional_vars, 'id', None) for w in self.with_stack[:-1]]
+
+        item = node.items[0]
+        expr = item.context_expr
+        target = expr.func if isinstance(expr, ast.Call) else expr
+        name = target.attr if isinstance(target, ast.Attribute) else target.id
+        if isinstance(expr, ast.Call):
+            attrs = ast.Dict(
+                keys=[ast.Constant(key.arg) for key in expr.keywords],
+                values=[key.value for key in expr.keywords],
+            )
+        else:
+            attrs = ast.Constant(None)
+
+        if name in components:
+            opening = _(f'yield from html.component("{name}", "{anchor(self.namespace["component"], expr)}", ...)')(
+                attrs
+            ).val().body[0]
+            tag = 'div'
+        elif name[0] in string.ascii_uppercase:
+            return _('yield html.react(...)')(attrs).val().body[0]
+        elif isinstance(expr, ast.Attribute) and expr.value.id in bindings:
+            # event handlers only exist on the client
+            return None
+        else:
+            opening = _(f'yield html.open("{name}", ...)')(attrs).val().body[0]
+            tag = name
+
+        body = self.visit_body(node.body)
+        if item.optional_vars:
+            body.insert(0, _(f'{item.optional_vars.id} = None').val().body[0])
+        return [opening, *body, _(f'yield html.close("{tag}")').val().body[0]]
+
+
 class PyodideNodeRenderer(NodeRenderer):
     def pyodidize_body(self, node_body):
         body, stmts = [], []
@@ -496,6 +827,16 @@ class ActionRenderer(BaseRenderer):
         for stmt in node.body:
             self.visit(stmt)
 
+    def visit_AsyncFunctionDef(self, node):
+        self.visit_FunctionDef(node)
+
+    @property
+    def is_async(self):
+        return any(
+            isinstance(node, (ast.Await, ast.AsyncFor, ast.AsyncWith))
+            for stmt in self.response for node in ast.walk(stmt)
+        )
+
     def generic_visit(self, node):
         # TODO
         # consider this
@@ -558,16 +899,15 @@ class ActionRenderer(BaseRenderer):
                 ],
             ),
             body=self.response,
+            is_async=self.is_async,
         )
 
         request_func = ast.fix_missing_locations(request_func)
         response_func = ast.fix_missing_locations(response_func)
 
         request_func = JsTranslator(request_func).walk()
-        ns = {}
-        exec(ast.unparse(response_func), ns)
 
-        return (request_func, ns.popitem()[1])
+        return (request_func, define(ast.unparse(response_func)))
 
 
 class PyodideActionRenderer(ActionRenderer):
@@ -598,6 +938,7 @@ class FetchRenderer(ActionRenderer):
                 ],
             ),
             body=self.response,
+            is_async=self.is_async,
         )
 
         if self.receive:
@@ -644,11 +985,9 @@ class FetchRenderer(ActionRenderer):
 
         request_func = ast.fix_missing_locations(request_func)
         response_func = ast.fix_missing_locations(response_func)
-        ns = {}
-        exec(ast.unparse(response_func), ns)
         return (
             JsTranslator(request_func).walk().render(),
-            ns.popitem()[1]
+            define(ast.unparse(response_func))
         )
 
 
@@ -674,6 +1013,16 @@ class ReactTransplainer(JsTranslator):
             body=body,
         )
 
+    def visit(self, node):
+        ret = super().visit(node)
+        if (line := getattr(node, 'source_line', None)) is not None:
+            for target in (ret.body if isinstance(ret, grammar.JsModule) else [ret]):
+                if isinstance(target, Node):
+                    target.value.source_line = line
+                elif isinstance(target, grammar.JsAST):
+                    target.source_line = line
+        return ret
+
     def visit_With(self, node):
         self.with_stack.append(node)
         ret = self._visit_With(node)
@@ -799,12 +1148,12 @@ class ReactTransplainer(JsTranslator):
     def visit_Expr(self, node):
         match node:
             case ast.Expr(ast.Constant(str(value))):
-                const = ast.Constant(HTMLRenderer().render(value))
+                const = ast.Constant(HTMLRenderer.render(value))
                 return _('layout.push(...)')(const)
             case ast.Expr(ast.JoinedStr(value)):
                 for i, v in enumerate(value):
                     if isinstance(v, ast.Constant):
-                        value[i].value = HTMLRenderer().render(v.value)
+                        value[i].value = HTMLRenderer.render(v.value)
                 return _('layout.push(...)')(ast.JoinedStr(value))
             case _:
                 return grammar.JsExpr(value=self.visit(node.value))
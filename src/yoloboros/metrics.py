@@ -0,0 +1,128 @@
+import json
+import math
+import time
+import threading
+
+# latency buckets grow by 2 ** (1 / 4), so reported percentiles are within ~19% of the real value
+RATIO = 2 ** 0.25
+BASE = 1e-6
+# calls that match no registered handler share one entry, whatever the client sent
+UNKNOWN = ('<unknown>', '<unknown>')
+
+
+class Call:
+    def __init__(self, app, data):
+        self.app = app
+        self.identifier = data['identifier']
+        self.action = data['action']
+        self.request = data['request']
+        component = app.component.registry.get(self.identifier)
+        self.component = component.__name__ if component else self.identifier
+        self.resolved = component is not None and self.action in component.responses
+        self.response = None
+        self.exception = None
+        self.duration = None
+        self.start = time.perf_counter()
+
+    def notify(self, event):
+        for hook in self.app._hooks:
+            if callback := getattr(hook, event, None):
+                callback(self)
+
+    def done(self, response):
+        self.duration = time.perf_counter() - self.start
+        self.response = response
+        self.notify('after')
+        return response
+
+    def fail(self, exception):
+        self.duration = time.perf_counter() - self.start
+        self.exception = exception
+        self.notify('error')
+
+    async def wait(self, awaitable):
+        try:
+            response = await awaitable
+        except Exception as e:
+            self.fail(e)
+            raise
+        return self.done(response)
+
+
+def size(payload):
+    return len(json.dumps(payload, default=str))
+
+
+class Stats:
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def add(self, call, request_bytes, response_bytes):
+        self.count += 1
+        self.total += call.duration
+        self.max = max(self.max, call.duration)
+        bucket = max(0, math.ceil(math.log(max(call.duration, BASE) / BASE, RATIO)))
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+        if call.exception is not None:
+            self.errors += 1
+
+    def percentile(self, q):
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(BASE * RATIO ** bucket, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'mean': self.total / self.count,
+            'max': self.max,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+            'p99': self.percentile(0.99),
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+        }
+
+
+class Collector:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    def after(self, call):
+        self.record(call)
+
+    def error(self, call):
+        self.record(call)
+
+    def record(self, call):
+        request_bytes = size(call.request)
+        response_bytes = size(call.response) if call.exception is None else 0
+        with self.lock:
+            key = (call.component, call.action) if call.resolved else UNKNOWN
+            stats = self.stats.setdefault(key, Stats())
+            stats.add(call, request_bytes, response_bytes)
+
+    def snapshot(self):
+        ret = {}
+        with self.lock:
+            for (component, action), stats in sorted(self.stats.items()):
+                ret.setdefault(component, {})[action] = stats.snapshot()
+        return ret
+
+    def reset(self):
+        with self.lock:
+            self.stats.clear()
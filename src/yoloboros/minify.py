@@ -0,0 +1,69 @@
+import re
+import string
+
+from yoloboros import constants
+
+# python identifiers can't contain "$", so these never clash with translated code
+ALIASES = {
+    name: f'${string.ascii_letters[i]}'
+    for i, name in enumerate(sorted(
+        v for k, v in vars(constants).items()
+        if k.startswith('COMPONENT_') and v.isidentifier()
+    ))
+}
+
+TOKENS = re.compile(r'''
+    (?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|`(?:\\.|[^`\\])*`)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<name>[\w$]+)
+  | (?P<space>\s+)
+  | (?P<punct>.)
+''', re.S | re.X)
+
+# substitutions of a template literal, they are code like the rest
+SUBSTITUTION = re.compile(r'\$\{([^{}`]*)\}')
+
+WORD = frozenset(string.ascii_letters + string.digits + '_$')
+# a line ending in one of these can't end a statement, so the newline after it is dropped
+OPEN = frozenset('{([,;:=?&|*/%<>!^~.')
+CLOSE = frozenset('})].,;:?')
+
+
+def separator(output, token, newline):
+    last = output[-1]
+    if newline and not (
+        last in OPEN or token[0] in CLOSE
+        or (last in '+-' and output[-2:-1] != last)
+    ):
+        return '\n'
+    if (last in WORD and token[0] in WORD) or (last in '+-/' and token[0] == last):
+        return ' '
+    return ''
+
+
+def compact(code):
+    output = ''
+    space = None
+    marker = ''
+    for match in TOKENS.finditer(code):
+        kind, token = match.lastgroup, match.group()
+        if kind == 'space':
+            space = space or '\n' in token
+            continue
+        if kind == 'comment':
+            if token.startswith('/*@yolo:'):
+                # source map markers stay glued to the statement that follows them
+                marker += token
+            else:
+                space = space or token.startswith('//')
+            continue
+        if kind == 'name' and not output.endswith('.'):
+            token = ALIASES.get(token, token)
+        elif kind == 'string' and token[0] == '`':
+            token = SUBSTITUTION.sub(lambda m: '${' + compact(m[1]).rstrip('\n') + '}', token)
+        if output and space is not None:
+            output += separator(output, token, space)
+        output += marker + token
+        space = None
+        marker = ''
+    return output + '\n'
@@ -0,0 +1,71 @@
+import time
+import types
+import contextlib
+
+# the active profiler, set by Yoloboros.profile; phases are free when it is None
+current = None
+
+
+class Profiler:
+    def __init__(self):
+        self.phases = {}
+        self.component = None
+        self.stack = []
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        record = types.SimpleNamespace(size=0)
+        self.stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            elapsed = time.perf_counter() - start
+            # nested phases are subtracted, so every second is counted once
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += elapsed
+            entry = self.phases.setdefault((self.component, name), {'calls': 0, 'time': 0.0, 'size': 0})
+            entry['calls'] += 1
+            entry['time'] += elapsed - children
+            entry['size'] += record.size
+
+    def report(self):
+        ret = {}
+        for (component, name), entry in self.phases.items():
+            phases = ret.setdefault(component or '<app>', {'time': 0.0, 'phases': {}})
+            phases['phases'][name] = dict(entry)
+            phases['time'] += entry['time']
+        for phases in ret.values():
+            phases['phases'] = dict(sorted(phases['phases'].items(), key=lambda item: -item[1]['time']))
+        return dict(sorted(ret.items(), key=lambda item: -item[1]['time']))
+
+
+def phase(name):
+    if current is None:
+        return contextlib.nullcontext(types.SimpleNamespace(size=0))
+    return current.phase(name)
+
+
+def measure(name, func, *args, **kwargs):
+    if current is None:
+        return func(*args, **kwargs)
+    with current.phase(name) as record:
+        ret = func(*args, **kwargs)
+        if isinstance(ret, str):
+            record.size = len(ret)
+        return ret
+
+
+@contextlib.contextmanager
+def component(name):
+    if current is None:
+        yield
+        return
+    previous, current.component = current.component, name
+    try:
+        # whatever the finer phases don't cover is reported as "compile"
+        with current.phase('compile'):
+            yield
+    finally:
+        current.component = previous
@@ -0,0 +1,63 @@
+import re
+import sys
+import inspect
+
+# rendered statements are prefixed with /*@yolo:LINE*/, relocated to /*@yolo:MODULE:LINE*/
+LINE = re.compile(r'/\*@yolo:(\d+)\*/')
+MARKER = re.compile(r'/\*@yolo:([\w.]+):(\d+)\*/')
+ANY = re.compile(r'/\*@yolo:[\w.:]+\*/')
+# a marker alone on its line took the indentation of a line that is otherwise blank
+ALONE = re.compile(r'^[ \t]*(?:/\*@yolo:[\w.:]+\*/)+[ \t]*$', re.M)
+BASE64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+
+def relocate(code, module, start):
+    return LINE.sub(lambda m: f'/*@yolo:{module}:{int(m[1]) + start - 1}*/', code)
+
+
+def strip(code):
+    return ANY.sub('', ALONE.sub('', code))
+
+
+def vlq(value):
+    value = value << 1 if value >= 0 else (-value << 1) | 1
+    ret = ''
+    while True:
+        digit, value = value & 31, value >> 5
+        ret += BASE64[digit | 32 if value else digit]
+        if not value:
+            return ret
+
+
+def source(module):
+    try:
+        return inspect.getsource(sys.modules[module])
+    except (KeyError, OSError, TypeError):
+        return None
+
+
+def extract(code, file=None):
+    modules, lines, segments = [], [], []
+    previous = [0, 0]
+    for line in code.split('\n'):
+        parts, column, removed = [], 0, 0
+        for match in MARKER.finditer(line):
+            module, number = match[1], int(match[2]) - 1
+            if module not in modules:
+                modules.append(module)
+            index = modules.index(module)
+            position = match.start() - removed
+            removed += match.end() - match.start()
+            parts.append(vlq(position - column) + vlq(index - previous[0]) + vlq(number - previous[1]) + 'A')
+            column, previous = position, [index, number]
+        lines.append(strip(line))
+        segments.append(','.join(parts))
+    sourcemap = {
+        'version': 3,
+        'file': file,
+        'sources': [m.replace('.', '/') + '.py' for m in modules],
+        'sourcesContent': [source(m) for m in modules],
+        'names': [],
+        'mappings': ';'.join(segments),
+    }
+    return '\n'.join(lines), sourcemap
@@ -0,0 +1,114 @@
+import html
+import json
+import inspect
+
+VOID = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+MISSING = object()
+
+
+def string(value):
+    # same conversion String() and Array.join do in the browser
+    if value is None:
+        return ''
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def wrap(value):
+    if isinstance(value, dict):
+        return State(value)
+    if isinstance(value, list):
+        return [wrap(v) for v in value]
+    return value
+
+
+class State:
+    # not a dict, so keys like `items` or `get` are not shadowed by its methods
+    def __init__(self, data):
+        self.__dict__.update((k, wrap(v)) for k, v in data.items())
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return None
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+    def __setitem__(self, name, value):
+        setattr(self, name, value)
+
+
+class Instance:
+    def __init__(self, state):
+        self.state = wrap(state)
+
+
+class HTML:
+    def __init__(self, app):
+        self.app = app
+        self.counter = {}
+        self.components = {c.__name__: c for c in app.component.registry.values()}
+
+    def join(self, values):
+        return ''.join(map(string, values))
+
+    def open(self, tag, attrs=None):
+        ret, content = [f'<{tag}'], ''
+        for key, value in (attrs or {}).items():
+            if key == 'html':
+                content = string(value)
+                continue
+            if key == 'style':
+                value = '; '.join(f'{k}: {string(v)}' for k, v in value.items())
+            ret.append(f' {key}="{html.escape(string(value))}"')
+        return ''.join(ret) + '>' + content
+
+    def close(self, tag):
+        return '' if tag in VOID else f'</{tag}>'
+
+    def react(self, attrs=None):
+        return '<div></div>'
+
+    def state(self, component):
+        if 'fetch' in component.responses:
+            # the client sends an empty request for fetch as well
+            ret = component.responses['fetch'](component, {})
+            if inspect.isawaitable(ret):
+                ret.close()
+                return MISSING
+            return ret
+        if hasattr(component, 'init'):
+            try:
+                return component.init(Instance(None))
+            except Exception:
+                # init is written for the browser and may rely on its names or semantics, leave it to the client
+                return MISSING
+        return None
+
+    def render(self, component, attrs, state=MISSING):
+        if state is MISSING:
+            state = self.state(component)
+        if state is MISSING:
+            # rendered by the client once its state arrives
+            yield self.open('div', attrs)
+            return
+        yield self.open('div', {**attrs, 'yolo_state': json.dumps(state)})
+        if render := component.html_render(self.app):
+            yield from render(Instance(state), self)
+
+    def component(self, name, anchor, attrs=None):
+        index = self.counter.get(anchor, 0)
+        self.counter[anchor] = index + 1
+        attrs = {'yolo_for': name, **(attrs or {}), 'id': f'{anchor}-{index}'}
+        yield from self.render(self.components[name], attrs)
+
+    def root(self, id, state=MISSING):
+        root = next(c for c in self.components.values() if c.is_root)
+        yield from self.render(root, {'id': id}, state)
+        yield self.close('div')
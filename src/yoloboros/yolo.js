@@ -1,10 +1,24 @@
 var YOLO_REGISTRY = {};
 var YOLO_COMPONENTS = {};
 var YOLO_ANCHOR_COUNTER = {};
+var YOLO_CONFIG = {batch: false, endpoint: '/', reconcile: false};
+var YOLO_QUEUE = [];
+var YOLO_CHUNKS = {};
+var YOLO_HYDRATING = null;
+var YOLO_TEMPLATES = {};
 
 class YoloWrapper {
     constructor(element) {
-        this.element = element;
+        this._element = element;
+    }
+
+    get element() {
+        // a reconciled render keeps the live node instead of the one this wrapper was made for
+        let element = this._element;
+        while (element.__yolo_live) {
+            element = element.__yolo_live;
+        }
+        return element;
     }
 
     get id() {
@@ -40,13 +54,13 @@ class YoloWrapper {
     }
 
     setAction(instance, event, name, ...args) {
-        this.element.addEventListener(event, () => {
+        __yolo__listen(this.element, event, () => {
             instance.component.actions[name](instance, ...args);
         });
     }
 
     setCall(instance, event, name, ...args) {
-        this.element.addEventListener(event, () => {
+        __yolo__listen(this.element, event, () => {
             instance.component.namespace[name](...args);
         });
     }
@@ -67,26 +81,101 @@ const __yolo__after_root_render = () => {
 };
 
 
+const __yolo__claim = (parent) => {
+    let index = YOLO_HYDRATING.get(parent) || 0;
+    YOLO_HYDRATING.set(parent, index + 1);
+    return parent.children[index];
+};
+
+const __yolo__state = (element) => {
+    let state = element.getAttribute('yolo_state');
+    if (state === null) {
+        return undefined;
+    }
+    element.removeAttribute('yolo_state');
+    return JSON.parse(state);
+};
+
+
+const __yolo__same = (live, fresh) => {
+    if (live.nodeType !== fresh.nodeType) {
+        return false;
+    }
+    return live.nodeType !== 1 || (live.tagName === fresh.tagName && live.__yolo_anchor === fresh.__yolo_anchor);
+};
+
+const __yolo__patch = (live, fresh) => {
+    for (let attr of Array.from(fresh.attributes)) {
+        if (attr.name === 'id' && live.getAttribute('id')) {
+            continue;
+        }
+        if (live.getAttribute(attr.name) !== attr.value) {
+            live.setAttribute(attr.name, attr.value);
+        }
+    }
+    for (let attr of Array.from(live.attributes)) {
+        if (fresh.getAttribute(attr.name) === null) {
+            live.removeAttribute(attr.name);
+        }
+    }
+    (live.__yolo_listeners || []).forEach(([event, callback]) => live.removeEventListener(event, callback));
+    (fresh.__yolo_listeners || []).forEach(([event, callback]) => live.addEventListener(event, callback));
+    live.__yolo_listeners = fresh.__yolo_listeners;
+    fresh.__yolo_live = live;
+    if (fresh.__yolo_react) {
+        ReactDOM.render(fresh.__yolo_react, live);
+        return;
+    }
+
+    let index = 0;
+    for (let node of Array.from(fresh.childNodes)) {
+        let current = live.childNodes[index++];
+        if (!current || !__yolo__same(current, node)) {
+            live.insertBefore(node, current || null);
+        } else if (current.nodeType === 1) {
+            __yolo__patch(current, node);
+        } else if (current.data !== node.data) {
+            current.data = node.data;
+        }
+    }
+    while (live.childNodes.length > index) {
+        live.removeChild(live.lastChild);
+    }
+};
+
+
 const __yolo__create_element = (tag, anchor, attrs=null, parent=null, react_mapping=null, cb=null) => {
     let element = null
     let yolo_elem = tag.startsWith('yolo:');
+    let hydrating = YOLO_HYDRATING && parent;
     if (tag.startsWith('react:')) {
         // TODO: add callback logic
         // TODO: add props logic
         component = tag.substring(6);
         element = React.createElement(react_mapping[component], attrs, null);
-        container = document.createElement('div');
-        parent.appendChild(container);
+        if (hydrating) {
+            container = __yolo__claim(parent);
+        } else {
+            container = document.createElement('div');
+            parent.appendChild(container);
+        }
+        container.__yolo_anchor = anchor;
+        container.__yolo_react = element;
         ReactDOM.render(element, container);
         return element;
     }
     let yolo_instance = null;
-    if (yolo_elem) {
+    let state = undefined;
+    if (hydrating) {
+        element = __yolo__claim(parent);
+        state = yolo_elem ? __yolo__state(element) : undefined;
+    } else if (yolo_elem) {
         element = document.createElement('div');
         element.setAttribute('yolo_for', tag.substring(5));
     } else {
         element = document.createElement(tag);
     }
+    element.__yolo_anchor = anchor;
     if (attrs) {
         for (let key in attrs) {
             if ('style' === key) {
@@ -96,7 +185,9 @@ const __yolo__create_element = (tag, anchor, attrs=null, parent=null, react_mapp
             } else if ('class' === key) {
                 element.className = attrs[key];
             } else if ('html' === key) {
-                element.innerHTML = attrs[key];
+                if (!hydrating) {
+                    element.innerHTML = attrs[key];
+                }
             } else {
                 element.setAttribute(key, attrs[key]);
             }
@@ -107,41 +198,77 @@ const __yolo__create_element = (tag, anchor, attrs=null, parent=null, react_mapp
             YOLO_ANCHOR_COUNTER[anchor] = 0;
         }
         anchor = `${anchor}-${YOLO_ANCHOR_COUNTER[anchor]++}`;
-        if (!(yolo_instance = YOLO_REGISTRY[anchor])) {
-            yolo_instance = YOLO_REGISTRY[anchor] = YOLO_COMPONENTS[tag.substring(5)].make(anchor);
-        }
         element.setAttribute('id', anchor);
-        element = yolo_instance.render(element);
+        if ((yolo_instance = YOLO_REGISTRY[anchor])) {
+            element = yolo_instance.render(element);
+        } else if (YOLO_COMPONENTS[tag.substring(5)]) {
+            yolo_instance = YOLO_REGISTRY[anchor] = YOLO_COMPONENTS[tag.substring(5)].make(anchor, state);
+            element = yolo_instance.render(element);
+        } else {
+            __yolo__load(tag.substring(5)).then((component) => {
+                if (!YOLO_REGISTRY[anchor]) {
+                    YOLO_REGISTRY[anchor] = component.make(anchor, state);
+                }
+                YOLO_REGISTRY[anchor].render(element);
+            });
+        }
     }
     if (cb) {
         cb(element);
     }
-    if (parent) {
+    if (parent && !hydrating) {
         parent.appendChild(element);
     }
     return element;
 };
 
+const __yolo__static = (html, anchor, parent) => {
+    let element = null;
+    if (YOLO_HYDRATING) {
+        element = __yolo__claim(parent);
+    } else {
+        let template = YOLO_TEMPLATES[anchor];
+        if (!template) {
+            template = YOLO_TEMPLATES[anchor] = document.createElement('template');
+            template.innerHTML = html;
+        }
+        element = parent.appendChild(template.content.firstChild.cloneNode(true));
+    }
+    element.__yolo_anchor = anchor;
+    return element;
+};
+
 const __yolo__text = (element, text) => {
+    if (YOLO_HYDRATING) {
+        return;
+    }
     if (element instanceof YoloWrapper) {
         element = element.element;
     }
-
-    if (!element.innerHTML) {
-        element.innerHTML = '';
-    }
-
-    element.innerHTML += text;
+    // parses only the new fragment instead of re-serializing the whole element
+    element.insertAdjacentHTML('beforeend', text);
 };
 
 
 class YoloInstance {
-    constructor(component, anchor=null) {
+    constructor(component, anchor=null, state=undefined) {
         this.component = component;
         this.namespace = {};
         this.state = null;
-        let val = component.init(this);
-        if (val) { this.state = val; }
+        let val = state === undefined ? component.init(this) : null;
+        if (state !== undefined) {
+            this.state = state;
+        } else if (val instanceof Promise) {
+            this.pending = val.then(() => {
+                this.pending = null;
+                if (this.rendered) { this.render(); }
+            }, (error) => {
+                // reported, then rendered with null state like an init that returns nothing
+                this.pending = null;
+                (YOLO_CONFIG.onerror || console.error)(error, this);
+                if (this.rendered) { this.render(); }
+            });
+        } else if (val) { this.state = val; }
         this.cid = anchor ? anchor : crypto.randomUUID();
     }
 
@@ -157,10 +284,23 @@ class YoloInstance {
         } else {
             element = document.getElementById(this.cid);
         }
-        element.innerHTML = '';
+        if (!YOLO_HYDRATING && !(YOLO_CONFIG.reconcile && element.__yolo_owner === this)) {
+            element.innerHTML = '';
+        }
         this.namespace = {};
-        element.setAttribute('id', this.cid);
-        this.component._render(this, element);
+        if (element.getAttribute('id') !== this.cid) {
+            element.setAttribute('id', this.cid);
+        }
+        this.rendered = true;
+        if (YOLO_CONFIG.reconcile && !YOLO_HYDRATING && !this.pending && element.__yolo_owner === this) {
+            let fresh = element.cloneNode(false);
+            fresh.__yolo_owner = this;
+            this.component._render(this, fresh);
+            __yolo__patch(element, fresh);
+        } else if (!this.pending) {
+            this.component._render(this, element);
+        }
+        element.__yolo_owner = this;
         if (this.component.is_root) {
             __yolo__after_root_render();
         }
@@ -177,8 +317,20 @@ class YoloComponent {
         this.is_root = is_root;
     }
 
-    make(anchor=null) {
-        return new YoloInstance(this, anchor);
+    make(anchor=null, state=undefined) {
+        return new YoloInstance(this, anchor, state);
+    }
+
+    hydrate(domid) {
+        let element = document.getElementById(domid);
+        let instance = this.make(domid, __yolo__state(element));
+        YOLO_HYDRATING = new WeakMap();
+        try {
+            instance.render(element);
+        } finally {
+            YOLO_HYDRATING = null;
+        }
+        return instance;
     }
 }
 
@@ -187,28 +339,76 @@ const __yolo__make_component = (identifier, init, render, actions, is_root) => {
 };
 
 
+const __yolo__post = (data) => {
+    return fetch(YOLO_CONFIG.endpoint, {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(data),
+    }).then((response) => {
+        if (!response.ok) {
+            throw new Error(`${response.status} ${response.statusText}`);
+        }
+        return response.json();
+    });
+};
+
 const __yolo__fetch = (identifier, action, request_json, callback, ...args) => {
-    const request = new XMLHttpRequest();
-    request.open('POST', `/`, false);  // TODO: fix race between fetch and render
-    request.setRequestHeader('Content-Type', 'application/json');
-    request_data = request_json();
+    let request_data = request_json();
     if (args.length > 0) {
         request_data['args'] = args;
     }
-    request.onload = () => {
-        if (request.status >= 200 && request.status < 400) {
-            callback(request_data, JSON.parse(request.responseText));
-        } else {
-            console.log('error');
-        }
-    };
-    request.send(JSON.stringify({
-        'identifier': identifier,
-        'action': action,
-        'request': request_data,
-    }));
+    let item = {'identifier': identifier, 'action': action, 'request': request_data};
+    if (YOLO_CONFIG.batch) {
+        return new Promise((resolve, reject) => {
+            if (YOLO_QUEUE.push([item, callback, resolve, reject]) === 1) {
+                queueMicrotask(__yolo__flush);
+            }
+        });
+    }
+    // failures reject, so a component waiting on fetch stays pending instead of rendering null state
+    return __yolo__post(item).then((response) => callback(request_data, response));
+};
+
+const __yolo__flush = () => {
+    const queue = YOLO_QUEUE;
+    YOLO_QUEUE = [];
+    __yolo__post({'batch': queue.map(([item]) => item)}).then((response) => {
+        response.batch.forEach((result, i) => {
+            const [item, callback, resolve, reject] = queue[i];
+            if ('error' in result) {
+                reject(new Error(result.error));
+                return;
+            }
+            try {
+                resolve(callback(item.request, result.response));
+            } catch (error) {
+                reject(error);
+            }
+        });
+    }, (error) => {
+        queue.forEach(([item, callback, resolve, reject]) => reject(error));
+    });
+};
+
+const __yolo__load = (name) => {
+    if (!YOLO_CHUNKS[name]) {
+        YOLO_CHUNKS[name] = __yolo__post({'chunk': name}).then((response) => {
+            new Function(response.code)();
+            return YOLO_COMPONENTS[name];
+        }).catch((error) => {
+            // forget the failed request, the next render of this component asks again
+            delete YOLO_CHUNKS[name];
+            throw error;
+        });
+    }
+    return YOLO_CHUNKS[name];
+};
+
+const __yolo__listen = (element, event, callback) => {
+    (element.__yolo_listeners = element.__yolo_listeners || []).push([event, callback]);
+    element.addEventListener(event, callback);
 };
 
 const __yolo__add_event_listener = (wrapper, event, callback) => {
-    wrapper.element.addEventListener(event, callback);
+    __yolo__listen(wrapper.element, event, callback);
 };
@@ -0,0 +1,41 @@
+import json
+import shutil
+import pathlib
+import importlib
+import itertools
+import subprocess
+
+import pytest
+
+DOM = pathlib.Path(__file__).with_name('dom.js').read_text()
+COUNTER = itertools.count()
+
+
+@pytest.fixture
+def load(tmp_path, monkeypatch):
+    # components are compiled from their source, so every test app lives in a module of its own
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def load(source, **flags):
+        name = f'app_{next(COUNTER)}'
+        (tmp_path / f'{name}.py').write_text(source)
+        app = importlib.import_module(name).App
+        for k, v in flags.items():
+            setattr(app, k, v)
+        return app
+    return load
+
+
+@pytest.fixture
+def client():
+    # the value of `result` once a first client render in node has settled
+    if shutil.which('node') is None:
+        pytest.skip('needs node')
+
+    def render(app, setup='', result='root.innerHTML'):
+        script = '\n'.join([
+            DOM, app.prelude, setup, app.mount('root'),
+            f'setTimeout(() => console.log(JSON.stringify({result})), 0);',
+        ])
+        return json.loads(subprocess.run(['node', '-e', script], capture_output=True, text=True, check=True).stdout)
+    return render
@@ -0,0 +1,84 @@
+// just enough DOM for a first client render, serialized the way the server writes html
+class Node {
+    constructor() { this.childNodes = []; this.attrs = {}; this.parentNode = null; }
+    get firstChild() { return this.childNodes[0] || null; }
+    get lastChild() { return this.childNodes[this.childNodes.length - 1] || null; }
+    get nextSibling() {
+        const siblings = this.parentNode ? this.parentNode.childNodes : [];
+        return siblings[siblings.indexOf(this) + 1] || null;
+    }
+    appendChild(child) { return this.insertBefore(child, null); }
+    insertBefore(child, ref) {
+        if (child.parentNode) child.parentNode.removeChild(child);
+        const i = ref ? this.childNodes.indexOf(ref) : this.childNodes.length;
+        this.childNodes.splice(i, 0, child);
+        child.parentNode = this;
+        return child;
+    }
+    removeChild(child) {
+        this.childNodes.splice(this.childNodes.indexOf(child), 1);
+        child.parentNode = null;
+        return child;
+    }
+    setAttribute(k, v) { this.attrs[k] = String(v); }
+    getAttribute(k) { return k in this.attrs ? this.attrs[k] : null; }
+    removeAttribute(k) { delete this.attrs[k]; }
+    addEventListener() {}
+    get attributes() { return Object.entries(this.attrs).map(([name, value]) => ({name, value})); }
+    get innerHTML() { return this.childNodes.map((c) => c.outerHTML).join(''); }
+    set innerHTML(v) { this.childNodes = []; if (v) this.appendChild(new Text(v)); }
+    insertAdjacentHTML(position, v) { [...parse(v).childNodes].forEach((c) => this.appendChild(c)); }
+    cloneNode(deep) {
+        const copy = Object.assign(Object.create(Object.getPrototypeOf(this)), this, {childNodes: [], parentNode: null});
+        copy.attrs = {...this.attrs};
+        if (deep) this.childNodes.forEach((c) => copy.appendChild(c.cloneNode(true)));
+        return copy;
+    }
+}
+class Element extends Node {
+    constructor(tag) { super(); this.tagName = tag; this.style = {}; }
+    get nodeType() { return 1; }
+    get outerHTML() {
+        const attrs = Object.entries(this.attrs).map(([k, v]) => ` ${k}="${v}"`).join('');
+        return `<${this.tagName}${attrs}>${this.innerHTML}</${this.tagName}>`;
+    }
+}
+class Text extends Node {
+    constructor(data) { super(); this.data = data; }
+    get nodeType() { return 3; }
+    get outerHTML() { return this.data; }
+}
+// compiler markup nests as written, the cases where a browser would not are never emitted
+const VOID = ['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'];
+const ENTITIES = {'&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"', '&#x27;': "'"};
+const parse = (html) => {
+    const stack = [new Element('fragment')];
+    for (const [, tag, attrs, end, text] of html.matchAll(/<([a-z][a-z0-9]*)((?:\s+[\w-]+='[^']*')*)\s*>|<\/([a-z][a-z0-9]*)>|([^<]+)/g)) {
+        const parent = stack[stack.length - 1];
+        if (text) {
+            parent.appendChild(new Text(text));
+        } else if (end) {
+            stack.pop();
+        } else {
+            const element = parent.appendChild(new Element(tag));
+            for (const [, k, v] of attrs.matchAll(/([\w-]+)='([^']*)'/g)) {
+                element.attrs[k] = v.replace(/&(amp|lt|gt|quot|#x27);/g, (m) => ENTITIES[m]);
+            }
+            if (!VOID.includes(tag)) stack.push(element);
+        }
+    }
+    return stack[0];
+};
+const root = new Element('div');
+const document = {
+    createElement: (tag) => {
+        const element = new Element(tag);
+        if (tag === 'template') {
+            Object.defineProperty(element, 'innerHTML', {set(v) { element.content = parse(v); }});
+        }
+        return element;
+    },
+    createTextNode: (data) => new Text(data),
+    getElementById: () => root,
+};
+const crypto = {randomUUID: () => 'root'};
@@ -0,0 +1,84 @@
+import asyncio
+import warnings
+
+SOURCE = '''from yoloboros import Yoloboros
+
+
+class App(Yoloboros):
+    batch = True
+
+
+class Root(App.root):
+    def add(self):
+        request = yield {'value': 1}
+        request['log'].append(request['value'])
+        response = yield {'value': request['value'] + 1}
+
+    def fail(self):
+        request = yield {}
+        response = yield {'value': request['missing']}
+
+    async def wait(self):
+        request = yield {'delay': 0}
+        import asyncio
+        await asyncio.sleep(request['delay'])
+        request['log'].append(request['delay'])
+        response = yield {'delay': request['delay']}
+
+    def render(self):
+        "root"
+'''
+
+
+def item(action, **request):
+    return {'identifier': '0', 'action': action, 'request': request}
+
+
+def test_batch_answers_in_order_with_item_errors(load):
+    app = load(SOURCE)
+    app.code
+    log = []
+    ret = app.process({'batch': [
+        item('add', value=1, log=log),
+        item('fail'),
+        item('missing'),
+        item('add', value=2, log=log),
+    ]})
+    assert ret == {'batch': [
+        {'response': {'value': 2}},
+        {'error': "KeyError: 'missing'"},
+        {'error': "KeyError: 'missing'"},
+        {'response': {'value': 3}},
+    ]}
+    assert log == [1, 2]
+
+
+def test_sync_batch_refuses_async_actions(load):
+    app = load(SOURCE)
+    app.code
+    log = []
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        ret = app.process({'batch': [item('wait', delay=0, log=log), item('add', value=1, log=log)]})
+    assert ret['batch'][0] == {'error': 'TypeError: async action in a batch, serve it with aprocess'}
+    assert ret['batch'][1] == {'response': {'value': 2}}
+    assert log == [1]
+
+
+def test_async_batch_runs_items_in_order(load):
+    app = load(SOURCE)
+    app.code
+    log = []
+    ret = asyncio.run(app.aprocess({'batch': [
+        item('wait', delay=0.02, log=log),
+        item('wait', delay=0, log=log),
+        item('add', value=5, log=log),
+        item('fail'),
+    ]}))
+    assert ret == {'batch': [
+        {'response': {'delay': 0.02}},
+        {'response': {'delay': 0}},
+        {'response': {'value': 6}},
+        {'error': "KeyError: 'missing'"},
+    ]}
+    assert log == [0.02, 0, 5]
@@ -0,0 +1,37 @@
+import pytest
+
+HEADER = '''from yoloboros import Yoloboros
+
+
+class App(Yoloboros):
+    pass
+
+
+class Widget(App.react):
+    def render():
+        with div(klass="widget"):
+            "Widget"
+'''
+
+COMPONENT = '''
+class Component{i:04}(App.component):
+    def init(self):
+        return {{'value': {i}}}
+
+    def render(self):
+        with div:
+            f"Value: {{self.state.value}}"
+            with Widget:
+                pass
+'''
+
+
+@pytest.mark.parametrize('minify', [False, True])
+def test_bundle_grows_linearly(load, minify):
+    # identifiers are counters, so both steps add components whose ids have two digits
+    small, medium, large = (
+        load(HEADER + ''.join(COMPONENT.format(i=i) for i in range(n)), minify=minify).bundle
+        for n in (10, 20, 30)
+    )
+    assert large.size - medium.size == medium.size - small.size
+    assert large.join().count('class Widget extends React.Component') == 1
@@ -0,0 +1,38 @@
+import importlib.util
+
+from yoloboros import boros
+
+SOURCE = '''from yoloboros import Yoloboros
+
+
+class App(Yoloboros):
+    pass
+
+
+class Root(App.root):
+    def init(self):
+        return {'value': 1}
+
+    def render(self):
+        f"Value {self.state.value}"
+'''
+
+
+def test_cache_misses_on_a_new_compiler_or_interpreter(load, tmp_path, monkeypatch):
+    cache = tmp_path / 'cache'
+    app = load(SOURCE, cache_dir=str(cache))
+
+    def build():
+        app.invalidate()
+        code = app.code
+        return code, len(list(cache.iterdir()))
+
+    code, files = build()
+    assert files == 1
+    assert build() == (code, 1)
+
+    monkeypatch.setattr(boros, 'compiler_hash', lambda: 'another compiler')
+    assert build() == (code, 2)
+
+    monkeypatch.setattr(importlib.util, 'MAGIC_NUMBER', b'\0\0\r\n')
+    assert build() == (code, 3)
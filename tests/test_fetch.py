@@ -0,0 +1,33 @@
+import pytest
+
+SOURCE = '''from yoloboros import Yoloboros
+
+
+class App(Yoloboros):
+    pass
+
+
+class Root(App.root):
+    def fetch(self):
+        return {'value': 1}
+
+    def render(self):
+        if self.state:
+            f"Value {self.state.value}"
+        else:
+            "No value"
+'''
+
+SETUP = '''
+const fetch = () => Promise.reject(new Error('offline'));
+const errors = [];
+YOLO_CONFIG.onerror = (error, instance) => errors.push([error.message, instance.component.identifier]);
+'''
+
+
+@pytest.mark.parametrize('batch', [False, True])
+def test_failed_fetch_reports_and_renders(load, client, batch):
+    app = load(SOURCE, batch=batch)
+    html, errors = client(app, SETUP, '[root.innerHTML, errors]')
+    assert errors == [['offline', '0']]
+    assert html == 'No&nbsp;value'
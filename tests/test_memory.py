@@ -0,0 +1,47 @@
+import ast
+import tracemalloc
+
+from yoloboros.grammar import syntax as grammar, transplainers
+
+SOURCE = '\n'.join(f'x{i} = foo(a, b[{i}], "s{i}") + {i} * y.z' for i in range(200))
+
+
+def subclasses(cls):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from subclasses(sub)
+
+
+def test_js_nodes_have_no_dict():
+    for cls in subclasses(grammar.JsAST):
+        assert not hasattr(cls(), '__dict__'), cls.__name__
+
+
+def traced(func, *args):
+    tracemalloc.start()
+    try:
+        ret = func(*args)
+        return ret, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_js_tree_is_smaller_than_ast_nodes():
+    # the same tree built from ast.AST subclasses, which is what Js nodes used to be
+    twins = {cls: type(cls.__name__, (ast.AST,), {'_fields': cls._fields}) for cls in subclasses(grammar.JsAST)}
+
+    def twin(node):
+        if isinstance(node, list):
+            return [twin(v) for v in node]
+        if not isinstance(node, grammar.JsAST):
+            return node
+        ret = twins[type(node)]()
+        for field in node._fields:
+            setattr(ret, field, twin(getattr(node, field)))
+        if (line := getattr(node, 'source_line', None)) is not None:
+            ret.source_line = line
+        return ret
+
+    tree, size = traced(transplainers.JsTranslator(ast.parse(SOURCE)).walk)
+    _, old = traced(twin, tree)
+    assert size < old / 2
@@ -0,0 +1,6 @@
+from yoloboros import constants, minify
+
+
+def test_template_literal_substitutions_are_aliased():
+    code = minify.compact(f'let a = `x ${{ {constants.COMPONENT_TEXT}(a, b) }}-${{c}} {constants.COMPONENT_TEXT}`;')
+    assert code == f'let a=`x ${{{minify.ALIASES[constants.COMPONENT_TEXT]}(a,b)}}-${{c}} {constants.COMPONENT_TEXT}`;\n'
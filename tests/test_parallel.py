@@ -0,0 +1,64 @@
+import sys
+
+SOURCE = '''from yoloboros import Yoloboros
+
+
+class App(Yoloboros):
+    pass
+
+
+class Widget(App.react):
+    def render():
+        with div:
+            "widget"
+
+
+class Item(App.component):
+    def fetch(self):
+        return {'value': 1}
+
+    def render(self):
+        with li:
+            f"item {self.state.value}"
+
+
+class Root(App.root):
+    def init(self):
+        return {'count': 0}
+
+    def bump(self):
+        request = yield {'count': self.state.count}
+        response = yield {'count': request['count'] + 1}
+        self.state.count = response['count']
+        self.render()
+
+    def render(self):
+        with ul:
+            with Item:
+                pass
+        with Widget:
+            pass
+        with button as btn:
+            with btn.click:
+                request = yield {}
+                response = yield {'clicked': True}
+            "go"
+'''
+
+
+def test_parallel_build_is_identical_to_serial(load):
+    app = load(SOURCE)
+    components = list(app.component.registry.values())
+    parallel = app.build_parallel()
+    responses = {c: set(c.responses) for c in components}
+    serial = [c.build(app) for c in components]
+    assert parallel == serial
+    assert responses == {c: set(c.responses) for c in components}
+
+
+def test_parallel_build_falls_back_when_workers_cannot_find_the_app(load, monkeypatch):
+    app = load(SOURCE.replace('    def bump(self):', '    def _bump(self):'))
+    # pickle then finds a different App under the module's name, like an app made in __main__ under spawn
+    monkeypatch.delitem(sys.modules, app.__module__)
+    codes = app.build_parallel()
+    assert codes == [c.build(app) for c in app.component.registry.values()]
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+SOURCE = '''from yoloboros import Yoloboros
+
+
+class App(Yoloboros):
+    pass
+
+
+class Root(App.root):
+    def init(self):
+        return {'items': [1, 2]}
+
+    def render(self):
+        with ul:
+            for item in self.state.items:
+                with li:
+                    f"item {item}"
+'''
+
+
+@pytest.mark.parametrize('minify', [False, True])
+def test_markers_leave_no_trace(load, minify):
+    app = load(SOURCE, minify=minify)
+    plain = app.assets()['bundle']
+    app.sourcemap = True
+    app.invalidate()
+    mapped = app.assets()['bundle']
+    assert '@yolo' not in plain.body.decode()
+    assert not [line for line in plain.body.decode().split('\n') if line and not line.strip()]
+    body = mapped.body.decode().split('\n//# sourceMappingURL=')[0]
+    assert body == plain.body.decode()
+    assert json.loads(mapped.map)['mappings']
@@ -0,0 +1,90 @@
+import pytest
+
+SOURCE = '''from yoloboros import Yoloboros
+
+
+class App(Yoloboros):
+    pass
+
+
+class Item(App.component):
+    def init(self):
+        return {'items': ['x', 'y'], 'get': 'g'}
+
+    def render(self):
+        with span:
+            for item in self.state.items:
+                f"{item}{self.state.get}"
+
+
+class Root(App.root):
+    def init(self):
+        return {'items': ['a', 'b', 3], 'keys': 2, 'values': 'v'}
+
+    def render(self):
+        with ul(klass="list"):
+            for item in self.state.items:
+                with li:
+                    f"item {item}"
+        with p:
+            f"{self.state.keys} {self.state.values}"
+        with Item:
+            pass
+        with Item:
+            pass
+'''
+
+
+@pytest.mark.parametrize('minify', [False, True])
+def test_ssr_matches_client(load, client, minify):
+    app = load(SOURCE, minify=minify)
+    server = ''.join(app.render_html('root'))
+    html = client(app)
+    assert html.count('<li>') == 3
+    assert html.count('<span>xgyg</span>') == 2
+    assert server.startswith('<div id="root" yolo_state=')
+    # nested components carry their state for hydration, the client keeps it in memory
+    assert server.replace(' yolo_state="{&quot;items&quot;: [&quot;x&quot;, &quot;y&quot;], &quot;get&quot;: &quot;g&quot;}"', '') \
+        .endswith(html + '</div>')
+
+
+FALLBACK = '''from yoloboros import Yoloboros
+
+
+class App(Yoloboros):
+    pass
+
+
+class Broken(App.component):
+    def init(self):
+        return {'length': self.state.items.length}
+
+    def render(self):
+        "broken"
+
+
+class Root(App.root):
+    def init(self):
+        return {'value': 1}
+
+    def render(self):
+        if self.state:
+            f"value {self.state.value}"
+        else:
+            "empty"
+        with Broken:
+            pass
+'''
+
+
+def test_failing_init_is_left_to_the_client(load):
+    app = load(FALLBACK)
+    html = ''.join(app.render_html('root'))
+    assert html.startswith('<div id="root" yolo_state="{&quot;value&quot;: 1}">value&nbsp;1<div yolo_for="Broken"')
+    assert 'broken' not in html
+
+
+def test_explicit_null_root_state(load):
+    app = load(FALLBACK)
+    html = ''.join(app.render_html('root', None))
+    assert html.startswith('<div id="root" yolo_state="null">empty<div yolo_for="Broken"')
@@ -0,0 +1,97 @@
+import ast
+import textwrap
+
+import pytest
+
+from yoloboros.grammar import transplainers
+
+SOURCE = '''from yoloboros import Yoloboros
+
+
+class App(Yoloboros):
+    pass
+
+
+class Root(App.root):
+    def render(self):
+        with div(klass="card"):
+            with h2:
+                "Title"
+            with p:
+                "Some "
+                with b:
+                    "bold"
+                " text <i>inline</i>"
+            with ul:
+                with li:
+                    "one"
+                    with ol:
+                        with li:
+                            "nested"
+            with a(href="/x?a=1&b='2'"):
+                with span:
+                    "link"
+            with br:
+                pass
+        with section:
+            with p:
+                with div:
+                    "inside"
+            with table:
+                with tr:
+                    with td:
+                        "cell"
+'''
+
+
+def static(source):
+    node = ast.parse(textwrap.dedent(source)).body[0]
+    return transplainers.NodeRenderer(None).static(node, [])
+
+
+@pytest.mark.parametrize('source', [
+    'with p:\n    with div:\n        "inside"',
+    'with p:\n    with span:\n        with ul:\n            pass',
+    'with p:\n    "<div>inside</div>"',
+    'with table:\n    with tr:\n        pass',
+    'with div:\n    with tr:\n        pass',
+    'with select:\n    with option:\n        "x"',
+    'with a:\n    with span:\n        with a:\n            "x"',
+    'with li:\n    with div:\n        with li:\n            "x"',
+    'with h1:\n    with h2:\n        "x"',
+    'with div:\n    "<b>unclosed"',
+])
+def test_static_refuses_what_the_parser_rewrites(source):
+    assert static(source) is None
+
+
+@pytest.mark.parametrize('source', [
+    'with p:\n    with span:\n        "x"',
+    'with li:\n    with ul:\n        with li:\n            "x"',
+    'with dl:\n    with dt:\n        "x"\n    with dd:\n        "y"',
+    'with div:\n    with p:\n        "x"\n    with p:\n        "<b>y</b>"',
+])
+def test_static_keeps_what_the_parser_keeps(source):
+    assert static(source) is not None
+
+
+def test_static_walks_each_node_once(monkeypatch):
+    renderer = transplainers.NodeRenderer(None)
+    calls = []
+    original = renderer._static_tree
+    monkeypatch.setattr(renderer, '_static_tree', lambda node, components: calls.append(node) or original(node, components))
+    node = ast.parse('with div:\n' + ''.join(f'{"    " * i}with div:\n' for i in range(1, 10)) + '    ' * 10 + 'x').body[0]
+    while isinstance(node, ast.With):
+        renderer.static(node, [])
+        node = node.body[0]
+    assert len(calls) == len(set(map(id, calls))) == 10
+
+
+@pytest.mark.parametrize('minify', [False, True])
+def test_static_matches_dynamic(load, client, monkeypatch, minify):
+    static = load(SOURCE, minify=minify)
+    assert 'klass=\'card\'' in static.code
+    monkeypatch.setattr(transplainers.NodeRenderer, 'static', lambda self, node, components: None)
+    dynamic = load(SOURCE, minify=minify)
+    assert 'klass=\'card\'' not in dynamic.code
+    assert client(static) == client(dynamic)